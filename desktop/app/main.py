@@ -16,6 +16,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from app.config import get_config, save_config, config_manager, APP_NAME, APP_VERSION
 from app.utils.logger import setup_logging, get_logger
+from app.utils.network import install_fast_event_loop
 from app.services.camera_discovery import CameraDiscoveryService
 from app.services.process_manager import ProcessManager, ProcessState
 from app.services.disk_manager import DiskManager, AlertLevel
@@ -165,6 +166,7 @@ class DesktopManager:
 
         # Inicia system tray
         if self.system_tray:
+            self.system_tray.set_loop(self._loop)
             if self.system_tray.start():
                 logger.info("System tray iniciado")
             else:
@@ -543,9 +545,8 @@ def main() -> int:
     args = parse_args()
 
     try:
-        # Windows: usa WindowsSelectorEventLoopPolicy
-        if sys.platform == "win32":
-            asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
+        # uvloop quando disponivel; Windows: usa WindowsSelectorEventLoopPolicy
+        install_fast_event_loop()
 
         return asyncio.run(main_async(args))
 
@@ -9,6 +9,9 @@ import sys
 import asyncio
 import subprocess
 import signal
+import time
+import shlex
+import json
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
@@ -22,10 +25,14 @@ except ImportError:
     psutil = None
 
 from ..utils.logger import get_logger, LoggerMixin
-from ..utils.network import is_port_available, find_available_port
+from ..utils.network import is_port_available, find_available_port_async
 
 logger = get_logger("process_manager")
 
+# No Linux o RSS e lido direto de /proc/<pid>/statm (mais barato que psutil)
+USE_PROC_STATM = sys.platform.startswith("linux")
+PAGE_SIZE = os.sysconf("SC_PAGESIZE") if USE_PROC_STATM else 0
+
 
 class ProcessState(Enum):
     """Estados possiveis de um processo."""
@@ -49,9 +56,14 @@ class ProcessInfo:
     last_error: str = ""
     cpu_percent: float = 0.0
     memory_mb: float = 0.0
-    command: str = ""
     working_dir: str = ""
     environment: Dict[str, str] = field(default_factory=dict)
+    _command_list: List[str] = field(default_factory=list, repr=False)
+
+    @property
+    def command(self) -> str:
+        """Comando do processo como string (montado apenas quando lido)."""
+        return shlex.join(self._command_list)
 
 
 class ProcessManager(LoggerMixin):
@@ -60,6 +72,9 @@ class ProcessManager(LoggerMixin):
     Responsavel por iniciar, parar e monitorar o servidor FastAPI.
     """
 
+    # Tempo (segundos) que stop() aguarda o monitoramento sair antes de cancela-lo
+    MONITOR_STOP_GRACE = 1.0
+
     def __init__(
         self,
         backend_dir: Optional[Path] = None,
@@ -94,8 +109,15 @@ class ProcessManager(LoggerMixin):
         self._info = ProcessInfo(name="skycamos-backend")
         self._running = False
         self._monitor_task: Optional[asyncio.Task] = None
+        self._stop_event: Optional[asyncio.Event] = None
+        self._restarting = False
         self._restart_count = 0
         self._callbacks: List[Callable[[ProcessState], None]] = []
+        self._statm_fd: Optional[int] = None
+        self._statm_pid: Optional[int] = None
+        self._psutil_proc: Optional[Any] = None
+        self._last_sample_ts = 0.0
+        self._min_sample_interval = 0.5
 
     @property
     def info(self) -> ProcessInfo:
@@ -126,18 +148,71 @@ class ProcessManager(LoggerMixin):
         if self._process and self._process.poll() is None:
             self._info.pid = self._process.pid
 
+            # Limita leituras de /proc a no maximo uma a cada _min_sample_interval
+            now = time.monotonic()
+            if now - self._last_sample_ts < self._min_sample_interval:
+                return
+            self._last_sample_ts = now
+
+            rss = self._read_statm_rss(self._process.pid) if USE_PROC_STATM else None
+            if rss is not None:
+                self._info.memory_mb = rss / (1024 * 1024)
+
             if psutil:
                 try:
-                    proc = psutil.Process(self._process.pid)
+                    proc = self._psutil_proc
+                    if proc is None or proc.pid != self._process.pid:
+                        proc = self._psutil_proc = psutil.Process(self._process.pid)
                     self._info.cpu_percent = proc.cpu_percent(interval=0.1)
-                    self._info.memory_mb = proc.memory_info().rss / (1024 * 1024)
+                    if rss is None:
+                        self._info.memory_mb = proc.memory_info().rss / (1024 * 1024)
                 except (psutil.NoSuchProcess, psutil.AccessDenied):
-                    pass
+                    self._psutil_proc = None
         else:
+            self._close_statm()
+            self._psutil_proc = None
+            self._last_sample_ts = 0.0
             self._info.pid = None
             self._info.cpu_percent = 0.0
             self._info.memory_mb = 0.0
 
+    def _read_statm_rss(self, pid: int) -> Optional[int]:
+        """
+        Le o RSS do processo direto de /proc/<pid>/statm (apenas Linux).
+        O descritor e mantido aberto entre leituras do mesmo PID.
+
+        Args:
+            pid: PID do processo
+
+        Returns:
+            RSS em bytes ou None se nao foi possivel ler
+        """
+        if self._statm_pid != pid:
+            self._close_statm()
+            try:
+                self._statm_fd = os.open(f"/proc/{pid}/statm", os.O_RDONLY)
+            except OSError:
+                return None
+            self._statm_pid = pid
+
+        try:
+            # Formato: size resident shared text lib data dt (em paginas)
+            fields = os.pread(self._statm_fd, 128, 0).split()
+            return int(fields[1]) * PAGE_SIZE
+        except (OSError, IndexError, ValueError):
+            self._close_statm()
+            return None
+
+    def _close_statm(self) -> None:
+        """Fecha o descritor de /proc/<pid>/statm, se aberto."""
+        if self._statm_fd is not None:
+            try:
+                os.close(self._statm_fd)
+            except OSError:
+                pass
+        self._statm_fd = None
+        self._statm_pid = None
+
     def _find_python(self) -> str:
         """
         Encontra o executavel Python.
@@ -193,7 +268,7 @@ class ProcessManager(LoggerMixin):
             # Verifica se a porta esta disponivel
             if not is_port_available(self.port, self.host):
                 # Tenta encontrar outra porta
-                new_port = find_available_port(self.port, self.port + 100)
+                new_port = await find_available_port_async(self.port, self.port + 100)
                 if new_port:
                     self.logger.warning(f"Porta {self.port} em uso, usando {new_port}")
                     self.port = new_port
@@ -210,7 +285,7 @@ class ProcessManager(LoggerMixin):
 
             # Constroi e executa comando
             command = self._build_command()
-            self._info.command = " ".join(command)
+            self._info._command_list = command
             self._info.working_dir = str(self.backend_dir)
 
             # Ambiente
@@ -274,6 +349,9 @@ class ProcessManager(LoggerMixin):
             True se parou com sucesso
         """
         if not self._process:
+            # Pode haver uma reinicializacao pendente (processo caiu)
+            if self._monitor_task:
+                await self._stop_monitoring()
             self.logger.warning("Backend nao esta em execucao")
             return True
 
@@ -310,6 +388,7 @@ class ProcessManager(LoggerMixin):
         finally:
             self._process = None
             self._info.pid = None
+            self._close_statm()
 
     async def restart(self) -> bool:
         """
@@ -331,6 +410,7 @@ class ProcessManager(LoggerMixin):
             return
 
         self._running = True
+        self._stop_event = asyncio.Event()
 
         async def monitor_loop():
             while self._running:
@@ -339,21 +419,53 @@ class ProcessManager(LoggerMixin):
                 except Exception as e:
                     self.logger.error(f"Erro no monitoramento: {e}")
 
-                await asyncio.sleep(self.health_check_interval)
+                if not self._running:
+                    break
+
+                # Aguarda o intervalo, acordando cedo se o monitoramento for parado
+                await self._wait_stop(self.health_check_interval)
 
         self._monitor_task = asyncio.create_task(monitor_loop())
         self.logger.debug("Monitoramento do backend iniciado")
 
+    async def _wait_stop(self, timeout: float) -> None:
+        """
+        Aguarda ate o timeout, retornando antes se o monitoramento for parado.
+
+        Args:
+            timeout: Tempo maximo de espera em segundos
+        """
+        if self._stop_event is None:
+            await asyncio.sleep(timeout)
+            return
+
+        try:
+            await asyncio.wait_for(self._stop_event.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            pass
+
     async def _stop_monitoring(self) -> None:
         """Para monitoramento do processo."""
         self._running = False
-        if self._monitor_task:
-            self._monitor_task.cancel()
-            try:
-                await self._monitor_task
-            except asyncio.CancelledError:
-                pass
+        if self._stop_event:
+            self._stop_event.set()
+
+        task = self._monitor_task
+        if task:
             self._monitor_task = None
+
+            # Parada cooperativa: o loop normalmente sai sozinho; se estiver
+            # ocupado e cancelado apos o prazo. Uma reinicializacao em andamento
+            # e cancelada na hora, para nao reportar RUNNING durante a parada
+            done = set()
+            if not self._restarting:
+                done, _ = await asyncio.wait({task}, timeout=self.MONITOR_STOP_GRACE)
+            if not done:
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
         self.logger.debug("Monitoramento do backend parado")
 
     async def _check_health(self) -> None:
@@ -383,8 +495,15 @@ class ProcessManager(LoggerMixin):
                 self._info.restart_count += 1
                 self.logger.info(f"Tentando reiniciar ({self._restart_count}/{self.max_restarts})...")
 
-                await asyncio.sleep(self.restart_delay)
-                await self.start()
+                # Espera o delay, mas desiste se o backend for parado nesse meio tempo
+                await self._wait_stop(self.restart_delay)
+                if not self._running:
+                    return
+                self._restarting = True
+                try:
+                    await self.start()
+                finally:
+                    self._restarting = False
             else:
                 if self._restart_count >= self.max_restarts:
                     self.logger.error("Numero maximo de reinicializacoes atingido")
@@ -479,6 +598,21 @@ class ProcessManager(LoggerMixin):
             "last_error": self._info.last_error
         }
 
+    def get_status_bytes(self) -> bytes:
+        """
+        Retorna status serializado em JSON (bytes).
+        Usa orjson quando disponivel, evitando o caminho dict -> str -> bytes.
+
+        Returns:
+            JSON do status em bytes
+        """
+        status = self.get_status_dict()
+        try:
+            import orjson
+        except ImportError:
+            return json.dumps(status, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+        return orjson.dumps(status)
+
 
 class MultiProcessManager(LoggerMixin):
     """
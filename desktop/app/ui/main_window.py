@@ -5,39 +5,134 @@ Interface principal (CLI inicialmente, preparada para GUI)
 """
 
 import asyncio
+import importlib.util
+import os
 import sys
-from typing import Optional, Dict, Any, List, Callable
+from typing import TYPE_CHECKING, Optional, Dict, Any, List, Callable, Tuple, Awaitable
+from types import MappingProxyType, SimpleNamespace
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 
-try:
-    from rich.console import Console
-    from rich.table import Table
-    from rich.panel import Panel
-    from rich.layout import Layout
-    from rich.live import Live
-    from rich.text import Text
-    from rich.progress import Progress, SpinnerColumn, TextColumn
-    from rich import box
-    RICH_AVAILABLE = True
-except ImportError:
-    RICH_AVAILABLE = False
-    Console = None
-
-try:
-    import click
-    CLICK_AVAILABLE = True
-except ImportError:
-    CLICK_AVAILABLE = False
-    click = None
-
 from ..utils.logger import get_logger, LoggerMixin
 from ..services.process_manager import ProcessState
 from ..services.camera_discovery import DiscoveredCamera, CameraProtocol
 from ..services.disk_manager import DiskUsage, AlertLevel
 
+if TYPE_CHECKING:
+    from rich.console import Group
+    from rich.live import Live
+    from rich.table import Table
+
 logger = get_logger("main_window")
 
+# Rich e Click sao importados sob demanda: apenas verifica se estao instalados
+RICH_AVAILABLE = importlib.util.find_spec("rich") is not None
+CLICK_AVAILABLE = importlib.util.find_spec("click") is not None
+
+# Classes do Rich, preenchidas por _import_rich() no primeiro uso da interface Rich
+_rich = SimpleNamespace(loaded=False)
+
+# Cores por estado do backend e nivel de alerta do disco
+_STATE_COLOR = MappingProxyType({
+    'running': 'green',
+    'stopped': 'red',
+    'starting': 'yellow',
+    'crashed': 'red bold'
+})
+_ALERT_COLOR = MappingProxyType({
+    'ok': 'green',
+    'warning': 'yellow',
+    'critical': 'red',
+    'full': 'red bold'
+})
+
+# Comandos internos da interface interativa
+QUIT_COMMANDS = frozenset(('quit', 'exit', 'q'))
+HELP_COMMANDS = frozenset(('help', 'h', '?'))
+
+# Cabecalho da aplicacao
+HEADER_TEXT = """
+   _____ _          _____                  ____   _____
+  / ____| |        / ____|                / __ \\ / ____|
+ | (___ | | ___   | |     __ _ _ __ ___  | |  | | (___
+  \\___ \\| |/ / |  | |    / _` | '_ ` _ \\ | |  | |\\___ \\
+  ____) |   <| |__| |___| (_| | | | | | || |__| |____) |
+ |_____/|_|\\_\\____|______\\__,_|_| |_| |_| \\____/|_____/
+
+        Desktop Manager v1.0.0
+"""
+
+# Menu de comandos (markup Rich)
+MENU_TEXT = """
+[bold cyan]Comandos disponiveis:[/bold cyan]
+
+  [green]status[/green]     - Exibe status do sistema
+  [green]cameras[/green]    - Lista cameras descobertas
+  [green]discover[/green]   - Inicia descoberta de cameras
+  [green]start[/green]      - Inicia o backend
+  [green]stop[/green]       - Para o backend
+  [green]restart[/green]    - Reinicia o backend
+  [green]disk[/green]       - Status do disco
+  [green]cleanup[/green]    - Limpa gravacoes antigas
+  [green]config[/green]     - Exibe configuracao
+  [green]autostart[/green]  - Configura inicio automatico
+  [green]help[/green]       - Exibe esta ajuda
+  [green]quit[/green]       - Sai da aplicacao
+
+"""
+
+
+def _import_rich() -> None:
+    """Importa as classes do Rich em _rich (apenas na primeira chamada)."""
+    if _rich.loaded:
+        return
+
+    from rich import box
+    from rich.console import Console, Group
+    from rich.live import Live
+    from rich.panel import Panel
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+    from rich.table import Table
+    from rich.text import Text
+
+    # Celulas de status pre-estilizadas (evita parse de markup por linha)
+    _rich.__dict__.update(
+        Console=Console, Group=Group, Table=Table, Panel=Panel, Live=Live,
+        Text=Text, Progress=Progress, SpinnerColumn=SpinnerColumn,
+        TextColumn=TextColumn, box=box,
+        online_text=Text("Online", style="green"),
+        offline_text=Text("Offline", style="red"),
+        loaded=True
+    )
+
+
+def _supports_ansi() -> bool:
+    """
+    Verifica se o terminal aceita sequencias ANSI (executado uma vez no import).
+
+    Returns:
+        True se sequencias ANSI podem ser escritas direto no stdout
+    """
+    if sys.platform != "win32":
+        return True
+
+    # Windows Terminal, ConEmu/ANSICON e terminais tipo MSYS definem estas variaveis
+    if os.environ.get("WT_SESSION") or os.environ.get("ANSICON") or os.environ.get("TERM"):
+        return True
+
+    try:
+        import ctypes
+
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.GetStdHandle(-11)  # STD_OUTPUT_HANDLE
+        mode = ctypes.c_ulong()
+        if not kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+            return False
+        return bool(mode.value & 0x0004)  # ENABLE_VIRTUAL_TERMINAL_PROCESSING
+    except Exception:
+        return False
+
 
 class CLIInterface(LoggerMixin):
     """
@@ -45,10 +140,37 @@ class CLIInterface(LoggerMixin):
     Fornece uma interface rica e interativa no terminal.
     """
 
+    # Suporte a ANSI detectado uma unica vez
+    _ANSI_SUPPORTED = _supports_ansi()
+
     def __init__(self):
         """Inicializa a interface CLI."""
-        self.console = Console() if RICH_AVAILABLE else None
+        if RICH_AVAILABLE:
+            _import_rich()
+        # Sem realce automatico nem emojis: a saida ja define seus estilos via markup
+        self.console = _rich.Console(
+            highlight=False,
+            emoji=False,
+            log_path=False,
+            soft_wrap=False
+        ) if RICH_AVAILABLE else None
         self._running = False
+        self._cam_table_cache: Optional[Tuple[tuple, Any]] = None
+
+        # Paineis estaticos montados uma unica vez (markup ja interpretado)
+        self._header_panel = None
+        self._menu_panel = None
+        if RICH_AVAILABLE:
+            self._header_panel = _rich.Panel(
+                _rich.Text(HEADER_TEXT),
+                title="[bold cyan]SkyCamOS[/bold cyan]",
+                border_style="cyan"
+            )
+            self._menu_panel = _rich.Panel(
+                _rich.Text.from_markup(MENU_TEXT),
+                title="[bold]Menu[/bold]",
+                border_style="cyan"
+            )
 
     def print(self, message: str, style: str = None) -> None:
         """
@@ -65,24 +187,10 @@ class CLIInterface(LoggerMixin):
 
     def print_header(self) -> None:
         """Imprime cabecalho da aplicacao."""
-        header = """
-   _____ _          _____                  ____   _____
-  / ____| |        / ____|                / __ \\ / ____|
- | (___ | | ___   | |     __ _ _ __ ___  | |  | | (___
-  \\___ \\| |/ / |  | |    / _` | '_ ` _ \\ | |  | |\\___ \\
-  ____) |   <| |__| |___| (_| | | | | | || |__| |____) |
- |_____/|_|\\_\\____|______\\__,_|_| |_| |_| \\____/|_____/
-
-        Desktop Manager v1.0.0
-"""
         if self.console:
-            self.console.print(Panel(
-                header,
-                title="[bold cyan]SkyCamOS[/bold cyan]",
-                border_style="cyan"
-            ))
+            self.console.print(self._header_panel)
         else:
-            print(header)
+            print(HEADER_TEXT)
 
     def print_status(
         self,
@@ -102,27 +210,34 @@ class CLIInterface(LoggerMixin):
             self._print_status_plain(backend_status, disk_status, cameras)
             return
 
-        # Cria layout
-        layout = Layout()
-        layout.split_row(
-            Layout(name="left", ratio=1),
-            Layout(name="right", ratio=1)
-        )
+        # Exibe paineis e tabela de cameras em uma unica escrita no terminal
+        self.console.print(self.build_status(backend_status, disk_status, cameras))
+        self.console.file.flush()
+
+    def build_status(
+        self,
+        backend_status: Dict[str, Any],
+        disk_status: Dict[str, Any],
+        cameras: List[DiscoveredCamera]
+    ) -> "Group":
+        """
+        Monta o quadro de status (backend, disco e cameras).
 
+        Args:
+            backend_status: Status do backend
+            disk_status: Status do disco
+            cameras: Lista de cameras
+
+        Returns:
+            Grupo Rich com paineis e tabela de cameras
+        """
         # Painel de Backend
-        backend_table = Table(show_header=False, box=box.SIMPLE)
+        backend_table = _rich.Table(show_header=False, box=_rich.box.SIMPLE)
         backend_table.add_column("Item", style="cyan")
         backend_table.add_column("Valor")
 
         state = backend_status.get('state', 'unknown')
-        state_color = {
-            'running': 'green',
-            'stopped': 'red',
-            'starting': 'yellow',
-            'crashed': 'red bold'
-        }.get(state, 'white')
-
-        backend_table.add_row("Status", f"[{state_color}]{state.upper()}[/{state_color}]")
+        backend_table.add_row("Status", _rich.Text(state.upper(), style=_STATE_COLOR.get(state, 'white')))
         backend_table.add_row("PID", str(backend_status.get('pid', 'N/A')))
         backend_table.add_row("Porta", str(backend_status.get('port', 'N/A')))
         backend_table.add_row("CPU", f"{backend_status.get('cpu_percent', 0):.1f}%")
@@ -130,20 +245,13 @@ class CLIInterface(LoggerMixin):
         backend_table.add_row("Reinicializacoes", str(backend_status.get('restart_count', 0)))
 
         # Painel de Disco
-        disk_table = Table(show_header=False, box=box.SIMPLE)
+        disk_table = _rich.Table(show_header=False, box=_rich.box.SIMPLE)
         disk_table.add_column("Item", style="cyan")
         disk_table.add_column("Valor")
 
         disk_info = disk_status.get('disk', {})
         alert = disk_info.get('alert_level', 'ok')
-        alert_color = {
-            'ok': 'green',
-            'warning': 'yellow',
-            'critical': 'red',
-            'full': 'red bold'
-        }.get(alert, 'white')
-
-        disk_table.add_row("Status", f"[{alert_color}]{alert.upper()}[/{alert_color}]")
+        disk_table.add_row("Status", _rich.Text(alert.upper(), style=_ALERT_COLOR.get(alert, 'white')))
         disk_table.add_row("Total", f"{disk_info.get('total_gb', 0):.1f} GB")
         disk_table.add_row("Usado", f"{disk_info.get('used_gb', 0):.1f} GB")
         disk_table.add_row("Livre", f"{disk_info.get('free_gb', 0):.1f} GB")
@@ -153,12 +261,11 @@ class CLIInterface(LoggerMixin):
         disk_table.add_row("Gravacoes", f"{recordings.get('size_gb', 0):.1f} GB")
         disk_table.add_row("Arquivos", str(recordings.get('file_count', 0)))
 
-        # Exibe paineis
-        self.console.print(Panel(backend_table, title="[bold]Backend[/bold]", border_style="blue"))
-        self.console.print(Panel(disk_table, title="[bold]Armazenamento[/bold]", border_style="blue"))
-
-        # Tabela de cameras
-        self.print_cameras_table(cameras)
+        return _rich.Group(
+            _rich.Panel(backend_table, title="[bold]Backend[/bold]", border_style="blue"),
+            _rich.Panel(disk_table, title="[bold]Armazenamento[/bold]", border_style="blue"),
+            self._build_cameras_table(cameras)
+        )
 
     def _print_status_plain(
         self,
@@ -194,11 +301,32 @@ class CLIInterface(LoggerMixin):
                 print(f"  {cam.ip_address}:{cam.port} - {cam.manufacturer} {cam.model}")
             return
 
-        table = Table(
+        self.console.print(self._build_cameras_table(cameras))
+
+    def _build_cameras_table(self, cameras: List[DiscoveredCamera]) -> "Table":
+        """
+        Monta a tabela de cameras.
+
+        Args:
+            cameras: Lista de cameras descobertas
+
+        Returns:
+            Tabela Rich
+        """
+        # Reaproveita a tabela se a lista de cameras nao mudou
+        key = tuple(
+            (c.ip_address, c.port, c.protocol.value, c.manufacturer,
+             c.model, c.is_online, c.last_seen)
+            for c in cameras
+        )
+        if self._cam_table_cache and self._cam_table_cache[0] == key:
+            return self._cam_table_cache[1]
+
+        table = _rich.Table(
             title="Cameras Descobertas",
             show_header=True,
             header_style="bold magenta",
-            box=box.ROUNDED
+            box=_rich.box.ROUNDED
         )
 
         table.add_column("IP", style="cyan")
@@ -209,18 +337,19 @@ class CLIInterface(LoggerMixin):
         table.add_column("Status")
         table.add_column("Ultima vez visto")
 
+        # So executado quando a lista muda (tabela memorizada acima)
+        add_row = table.add_row
+        online = _rich.online_text
+        offline = _rich.offline_text
         for cam in cameras:
-            status = "[green]Online[/green]" if cam.is_online else "[red]Offline[/red]"
-            last_seen = cam.last_seen.strftime("%H:%M:%S") if cam.last_seen else "N/A"
-
-            table.add_row(
+            add_row(
                 cam.ip_address,
                 str(cam.port),
                 cam.protocol.value.upper(),
                 cam.manufacturer,
                 cam.model,
-                status,
-                last_seen
+                online if cam.is_online else offline,
+                cam.last_seen.strftime("%H:%M:%S") if cam.last_seen else "N/A"
             )
 
         if not cameras:
@@ -229,31 +358,15 @@ class CLIInterface(LoggerMixin):
                 "", "", "", "", "", ""
             )
 
-        self.console.print(table)
+        self._cam_table_cache = (key, table)
+        return table
 
     def print_menu(self) -> None:
         """Imprime menu de opcoes."""
-        menu = """
-[bold cyan]Comandos disponiveis:[/bold cyan]
-
-  [green]status[/green]     - Exibe status do sistema
-  [green]cameras[/green]    - Lista cameras descobertas
-  [green]discover[/green]   - Inicia descoberta de cameras
-  [green]start[/green]      - Inicia o backend
-  [green]stop[/green]       - Para o backend
-  [green]restart[/green]    - Reinicia o backend
-  [green]disk[/green]       - Status do disco
-  [green]cleanup[/green]    - Limpa gravacoes antigas
-  [green]config[/green]     - Exibe configuracao
-  [green]autostart[/green]  - Configura inicio automatico
-  [green]help[/green]       - Exibe esta ajuda
-  [green]quit[/green]       - Sai da aplicacao
-
-"""
         if self.console:
-            self.console.print(Panel(menu, title="[bold]Menu[/bold]", border_style="cyan"))
+            self.console.print(self._menu_panel)
         else:
-            print(menu)
+            print(MENU_TEXT)
 
     async def show_progress(self, description: str, task_func: Callable) -> Any:
         """
@@ -270,9 +383,9 @@ class CLIInterface(LoggerMixin):
             print(f"{description}...")
             return await task_func()
 
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
+        with _rich.Progress(
+            _rich.SpinnerColumn(),
+            _rich.TextColumn("[progress.description]{task.description}"),
             console=self.console
         ) as progress:
             task = progress.add_task(description, total=None)
@@ -344,8 +457,11 @@ class CLIInterface(LoggerMixin):
         """Limpa a tela."""
         if self.console:
             self.console.clear()
+        elif self._ANSI_SUPPORTED:
+            # Escreve a sequencia de limpeza direto, sem criar subprocesso
+            sys.stdout.write("\x1b[2J\x1b[H")
+            sys.stdout.flush()
         else:
-            import os
             os.system('cls' if sys.platform == 'win32' else 'clear')
 
 
@@ -359,7 +475,9 @@ class MainWindow(LoggerMixin):
         """Inicializa a janela principal."""
         self.cli = CLIInterface()
         self._running = False
-        self._callbacks: Dict[str, Callable] = {}
+        self._async_callbacks: Dict[str, Callable] = {}
+        self._sync_callbacks: Dict[str, Callable] = {}
+        self._live: Optional["Live"] = None
 
     def register_callback(self, command: str, callback: Callable) -> None:
         """
@@ -369,7 +487,13 @@ class MainWindow(LoggerMixin):
             command: Nome do comando
             callback: Funcao a executar
         """
-        self._callbacks[command] = callback
+        # Classifica uma unica vez, no registro, em vez de a cada comando
+        if asyncio.iscoroutinefunction(callback):
+            self._sync_callbacks.pop(command, None)
+            self._async_callbacks[command] = callback
+        else:
+            self._async_callbacks.pop(command, None)
+            self._sync_callbacks[command] = callback
 
     async def run_interactive(self) -> None:
         """Executa interface interativa."""
@@ -401,12 +525,12 @@ class MainWindow(LoggerMixin):
             command: Comando digitado
         """
         # Comandos internos
-        if command in ('quit', 'exit', 'q'):
+        if command in QUIT_COMMANDS:
             self._running = False
             self.cli.print_info("Encerrando...")
             return
 
-        if command in ('help', 'h', '?'):
+        if command in HELP_COMMANDS:
             self.cli.print_menu()
             return
 
@@ -415,12 +539,10 @@ class MainWindow(LoggerMixin):
             return
 
         # Comandos com callbacks
-        if command in self._callbacks:
-            callback = self._callbacks[command]
-            if asyncio.iscoroutinefunction(callback):
-                await callback()
-            else:
-                callback()
+        if command in self._async_callbacks:
+            await self._async_callbacks[command]()
+        elif command in self._sync_callbacks:
+            self._sync_callbacks[command]()
         else:
             self.cli.print_warning(f"Comando desconhecido: {command}")
             self.cli.print_info("Digite 'help' para ver comandos disponiveis")
@@ -441,6 +563,50 @@ class MainWindow(LoggerMixin):
         """
         self.cli.print_status(backend_status, disk_status, cameras)
 
+    async def run_status_loop(
+        self,
+        poll: Callable[[], Awaitable[Tuple[Dict[str, Any], Dict[str, Any], List[DiscoveredCamera]]]],
+        interval: float = 1.0
+    ) -> None:
+        """
+        Exibe o status continuamente, atualizando a cada intervalo.
+        Com Rich, usa uma regiao Live que reescreve apenas o que mudou.
+
+        Args:
+            poll: Funcao async que retorna (backend_status, disk_status, cameras)
+            interval: Intervalo entre atualizacoes em segundos
+        """
+        self._running = True
+
+        if not self.cli.console:
+            while self._running:
+                self.show_status(*await poll())
+                await asyncio.sleep(interval)
+            return
+
+        with _rich.Live(
+            self._make_status_view(*await poll()),
+            console=self.cli.console,
+            auto_refresh=False,
+            screen=False
+        ) as live:
+            self._live = live
+            try:
+                while self._running:
+                    await asyncio.sleep(interval)
+                    live.update(self._make_status_view(*await poll()), refresh=True)
+            finally:
+                self._live = None
+
+    def _make_status_view(
+        self,
+        backend_status: Dict[str, Any],
+        disk_status: Dict[str, Any],
+        cameras: List[DiscoveredCamera]
+    ) -> Any:
+        """Monta o renderizavel de status usado pela regiao Live."""
+        return self.cli.build_status(backend_status, disk_status, cameras)
+
     def show_cameras(self, cameras: List[DiscoveredCamera]) -> None:
         """
         Exibe lista de cameras.
@@ -466,9 +632,11 @@ class MainWindow(LoggerMixin):
         self._running = False
 
 
+@lru_cache(maxsize=1)
 def create_cli_app():
     """
     Cria aplicacao CLI usando Click.
+    O grupo e montado uma unica vez e reutilizado nas chamadas seguintes.
 
     Returns:
         Grupo de comandos Click
@@ -476,6 +644,8 @@ def create_cli_app():
     if not CLICK_AVAILABLE:
         return None
 
+    import click
+
     @click.group()
     @click.version_option(version="1.0.0")
     def cli():
@@ -4,31 +4,24 @@ SkyCamOS Desktop Manager - System Tray
 Icone na bandeja do sistema com menu de contexto
 """
 
-import sys
 import asyncio
+import importlib.util
 import threading
-from typing import Optional, Callable, Dict, Any, List
-from pathlib import Path
+import logging
+from typing import TYPE_CHECKING, Optional, Callable, Dict, Any, Tuple
 from enum import Enum
 
-try:
-    import pystray
-    from pystray import MenuItem as Item, Menu
-    PYSTRAY_AVAILABLE = True
-except ImportError:
-    pystray = None
-    PYSTRAY_AVAILABLE = False
+from ..utils.logger import get_logger, LoggerMixin
 
-try:
-    from PIL import Image, ImageDraw
-    PILLOW_AVAILABLE = True
-except ImportError:
-    Image = None
-    ImageDraw = None
-    PILLOW_AVAILABLE = False
+if TYPE_CHECKING:
+    from pathlib import Path
 
-from ..utils.logger import get_logger, LoggerMixin
-from ..services.process_manager import ProcessState
+    from ..services.process_manager import ProcessState
+
+# pystray e Pillow sao importados apenas quando usados (ver start() e
+# _create_icon_image()); aqui so verifica se estao instalados
+PYSTRAY_AVAILABLE = importlib.util.find_spec("pystray") is not None
+PILLOW_AVAILABLE = importlib.util.find_spec("PIL") is not None
 
 logger = get_logger("system_tray")
 
@@ -41,6 +34,85 @@ class TrayStatus(Enum):
     OFFLINE = "offline"
 
 
+# Mascaras do desenho do icone por tamanho: (fundo, camera, lente)
+_MASK_CACHE: Dict[int, Tuple[Any, Any, Any]] = {}
+
+
+def _get_icon_masks(size: int) -> Tuple[Any, Any, Any]:
+    """
+    Retorna as mascaras (modo "L") do desenho do icone para um tamanho.
+    A forma independe da cor do status, entao e desenhada uma unica vez.
+
+    Args:
+        size: Tamanho do icone em pixels
+
+    Returns:
+        Tupla (fundo, camera, lente)
+    """
+    masks = _MASK_CACHE.get(size)
+    if masks is not None:
+        return masks
+
+    from PIL import Image, ImageDraw
+
+    # Circulo de fundo
+    background = Image.new('L', (size, size), 0)
+    margin = size // 8
+    ImageDraw.Draw(background).ellipse(
+        [margin, margin, size - margin, size - margin],
+        fill=255
+    )
+
+    # Camera estilizada: corpo (retangulo) + visor/flash (triangulo)
+    camera = Image.new('L', (size, size), 0)
+    draw = ImageDraw.Draw(camera)
+    cam_margin = size // 4
+
+    body_left = cam_margin
+    body_top = size // 3
+    body_right = size - cam_margin - size // 6
+    body_bottom = size - cam_margin
+
+    draw.rectangle(
+        [body_left, body_top, body_right, body_bottom],
+        fill=255
+    )
+
+    flash_left = body_right
+    flash_right = size - cam_margin
+    flash_top = body_top
+    flash_bottom = body_top + (body_bottom - body_top) // 2
+
+    draw.polygon(
+        [
+            (flash_left, flash_top),
+            (flash_right, (flash_top + flash_bottom) // 2),
+            (flash_left, flash_bottom)
+        ],
+        fill=255
+    )
+
+    # Lente da camera (circulo pequeno)
+    lens = Image.new('L', (size, size), 0)
+    lens_center_x = (body_left + body_right) // 2
+    lens_center_y = (body_top + body_bottom) // 2
+    lens_radius = (body_bottom - body_top) // 4
+
+    ImageDraw.Draw(lens).ellipse(
+        [
+            lens_center_x - lens_radius,
+            lens_center_y - lens_radius,
+            lens_center_x + lens_radius,
+            lens_center_y + lens_radius
+        ],
+        fill=255
+    )
+
+    masks = (background, camera, lens)
+    _MASK_CACHE[size] = masks
+    return masks
+
+
 class SystemTrayIcon(LoggerMixin):
     """
     Icone na bandeja do sistema (System Tray).
@@ -55,6 +127,38 @@ class SystemTrayIcon(LoggerMixin):
         TrayStatus.OFFLINE: (128, 128, 128) # Cinza
     }
 
+    # Status do icone por nome do ProcessState do backend
+    _PROCESS_STATE_MAP = {
+        "RUNNING": TrayStatus.OK,
+        "STARTING": TrayStatus.WARNING,
+        "STOPPING": TrayStatus.WARNING,
+        "RESTARTING": TrayStatus.WARNING,
+        "CRASHED": TrayStatus.ERROR,
+        "STOPPED": TrayStatus.OFFLINE
+    }
+
+    # Texto de status exibido no menu ({n} = numero de cameras)
+    _STATUS_TEXT = {
+        TrayStatus.OK: "Online - {n} cameras",
+        TrayStatus.WARNING: "Aviso - Verificar sistema",
+        TrayStatus.ERROR: "Erro - Backend offline",
+        TrayStatus.OFFLINE: "Offline"
+    }
+
+    # Acoes do menu: evento -> (rotulo para log, callback direto opcional)
+    _MENU_DISPATCH = {
+        "open": ("Abrir Interface", "on_open"),
+        "discover": ("Descobrir Cameras", None),
+        "start_backend": ("Iniciar Backend", None),
+        "stop_backend": ("Parar Backend", None),
+        "backend_status": ("Status Backend", None),
+        "settings": ("Configuracoes", "on_settings"),
+        "quit": ("Sair", "on_quit")
+    }
+
+    # Cache de imagens ja desenhadas por (status, tamanho)
+    _ICON_CACHE: Dict[Tuple[TrayStatus, int], Any] = {}
+
     def __init__(
         self,
         on_open: Optional[Callable[[], None]] = None,
@@ -81,6 +185,10 @@ class SystemTrayIcon(LoggerMixin):
         self._callbacks: Dict[str, Callable] = {}
         self._backend_running = False
         self._camera_count = 0
+        self._last_render_key: Optional[tuple] = None
+        self._menu: Optional[Any] = None
+        self._menu_handlers: Dict[str, Callable[[Any, Any], None]] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
 
         # Verifica disponibilidade
         if not PYSTRAY_AVAILABLE:
@@ -103,7 +211,7 @@ class SystemTrayIcon(LoggerMixin):
         """Define status e atualiza icone."""
         if value != self._status:
             self._status = value
-            self._update_icon()
+            self._request_update()
 
     def _create_icon_image(self, status: TrayStatus = None, size: int = 64) -> Optional[Any]:
         """
@@ -120,67 +228,28 @@ class SystemTrayIcon(LoggerMixin):
             return None
 
         status = status or self._status
-        color = self.COLORS.get(status, self.COLORS[TrayStatus.OFFLINE])
-
-        # Cria imagem
-        image = Image.new('RGBA', (size, size), (0, 0, 0, 0))
-        draw = ImageDraw.Draw(image)
-
-        # Desenha circulo de fundo
-        margin = size // 8
-        draw.ellipse(
-            [margin, margin, size - margin, size - margin],
-            fill=color
-        )
+        key = (status, size)
+        cached = self._ICON_CACHE.get(key)
+        if cached is not None:
+            return cached
 
-        # Desenha icone de camera estilizado
-        cam_color = (255, 255, 255)
-        cam_margin = size // 4
+        color = self.COLORS[status] if status in self.COLORS else self.COLORS[TrayStatus.OFFLINE]
 
-        # Corpo da camera (retangulo)
-        body_left = cam_margin
-        body_top = size // 3
-        body_right = size - cam_margin - size // 6
-        body_bottom = size - cam_margin
-
-        draw.rectangle(
-            [body_left, body_top, body_right, body_bottom],
-            fill=cam_color
-        )
+        from PIL import Image
 
-        # Lente da camera (circulo pequeno)
-        lens_center_x = (body_left + body_right) // 2
-        lens_center_y = (body_top + body_bottom) // 2
-        lens_radius = (body_bottom - body_top) // 4
-
-        draw.ellipse(
-            [
-                lens_center_x - lens_radius,
-                lens_center_y - lens_radius,
-                lens_center_x + lens_radius,
-                lens_center_y + lens_radius
-            ],
-            fill=color
-        )
+        # Compoe a imagem pintando as mascaras (calculadas uma vez por tamanho)
+        background, camera, lens = _get_icon_masks(size)
+        fill = (*color, 255)
 
-        # Visor/Flash da camera (triangulo)
-        flash_left = body_right
-        flash_right = size - cam_margin
-        flash_top = body_top
-        flash_bottom = body_top + (body_bottom - body_top) // 2
-
-        draw.polygon(
-            [
-                (flash_left, flash_top),
-                (flash_right, (flash_top + flash_bottom) // 2),
-                (flash_left, flash_bottom)
-            ],
-            fill=cam_color
-        )
+        image = Image.new('RGBA', (size, size), (0, 0, 0, 0))
+        image.paste(fill, mask=background)
+        image.paste((255, 255, 255, 255), mask=camera)
+        image.paste(fill, mask=lens)
 
+        self._ICON_CACHE[key] = image
         return image
 
-    def _load_icon_from_file(self, path: Path) -> Optional[Any]:
+    def _load_icon_from_file(self, path: "Path") -> Optional[Any]:
         """
         Carrega icone de um arquivo.
 
@@ -194,14 +263,17 @@ class SystemTrayIcon(LoggerMixin):
             return None
 
         try:
+            from PIL import Image
             return Image.open(path)
         except Exception as e:
-            self.logger.debug(f"Erro ao carregar icone: {e}")
+            self.logger.debug("Erro ao carregar icone: %s", e)
             return None
 
     def _create_menu(self) -> Any:
         """
         Cria menu de contexto.
+        Os campos dinamicos sao callables, avaliados pelo pystray ao exibir
+        o menu, entao o menu e criado uma unica vez.
 
         Returns:
             Menu pystray
@@ -209,6 +281,16 @@ class SystemTrayIcon(LoggerMixin):
         if not PYSTRAY_AVAILABLE:
             return None
 
+        from pystray import Menu
+        from pystray import MenuItem as Item
+
+        if not self._menu_handlers:
+            self._menu_handlers = {
+                event: self._make_menu_handler(event)
+                for event in self._MENU_DISPATCH
+            }
+        handlers = self._menu_handlers
+
         # Itens do menu
         items = [
             Item(
@@ -218,47 +300,47 @@ class SystemTrayIcon(LoggerMixin):
             ),
             Menu.SEPARATOR,
             Item(
-                self._get_status_text(),
+                lambda item: self._get_status_text(),
                 None,
                 enabled=False
             ),
             Menu.SEPARATOR,
             Item(
                 "Abrir Interface",
-                self._on_menu_open,
+                handlers["open"],
                 default=True
             ),
             Item(
                 "Descobrir Cameras",
-                self._on_menu_discover
+                handlers["discover"]
             ),
             Menu.SEPARATOR,
             Item(
                 "Backend",
                 Menu(
                     Item(
-                        "Iniciar" if not self._backend_running else "Reiniciar",
-                        self._on_menu_start_backend
+                        lambda item: "Reiniciar" if self._backend_running else "Iniciar",
+                        handlers["start_backend"]
                     ),
                     Item(
                         "Parar",
-                        self._on_menu_stop_backend,
-                        enabled=self._backend_running
+                        handlers["stop_backend"],
+                        enabled=lambda item: self._backend_running
                     ),
                     Item(
                         "Status",
-                        self._on_menu_backend_status
+                        handlers["backend_status"]
                     )
                 )
             ),
             Item(
                 "Configuracoes",
-                self._on_menu_settings
+                handlers["settings"]
             ),
             Menu.SEPARATOR,
             Item(
                 "Sair",
-                self._on_menu_quit
+                handlers["quit"]
             )
         ]
 
@@ -266,19 +348,24 @@ class SystemTrayIcon(LoggerMixin):
 
     def _get_status_text(self) -> str:
         """Retorna texto de status para o menu."""
-        status_map = {
-            TrayStatus.OK: f"Online - {self._camera_count} cameras",
-            TrayStatus.WARNING: "Aviso - Verificar sistema",
-            TrayStatus.ERROR: "Erro - Backend offline",
-            TrayStatus.OFFLINE: "Offline"
-        }
-        return status_map.get(self._status, "Status desconhecido")
+        if self._status is TrayStatus.OK:
+            return self._STATUS_TEXT[TrayStatus.OK].format(n=self._camera_count)
+        return self._STATUS_TEXT.get(self._status, "Status desconhecido")
+
+    def _render_key(self) -> tuple:
+        """Retorna o estado que determina a aparencia do icone e do menu."""
+        return (self._status, self._tooltip, self._backend_running, self._camera_count)
 
     def _update_icon(self) -> None:
         """Atualiza icone e tooltip."""
         if not self._icon:
             return
 
+        # Nada mudou desde a ultima atualizacao
+        key = self._render_key()
+        if key == self._last_render_key:
+            return
+
         try:
             # Atualiza imagem
             new_image = self._create_icon_image()
@@ -288,60 +375,78 @@ class SystemTrayIcon(LoggerMixin):
             # Atualiza tooltip
             self._icon.title = self._tooltip
 
-            # Atualiza menu
-            self._icon.menu = self._create_menu()
+            # Reavalia os campos dinamicos do menu
+            self._icon.update_menu()
+
+            self._last_render_key = key
 
         except Exception as e:
-            self.logger.debug(f"Erro ao atualizar icone: {e}")
-
-    def _on_menu_open(self, icon=None, item=None) -> None:
-        """Handler para abrir interface."""
-        self.logger.debug("Menu: Abrir Interface")
-        if self.on_open:
-            self.on_open()
-        if "open" in self._callbacks:
-            self._callbacks["open"]()
-
-    def _on_menu_discover(self, icon=None, item=None) -> None:
-        """Handler para descobrir cameras."""
-        self.logger.debug("Menu: Descobrir Cameras")
-        if "discover" in self._callbacks:
-            self._callbacks["discover"]()
-
-    def _on_menu_start_backend(self, icon=None, item=None) -> None:
-        """Handler para iniciar backend."""
-        self.logger.debug("Menu: Iniciar Backend")
-        if "start_backend" in self._callbacks:
-            self._callbacks["start_backend"]()
-
-    def _on_menu_stop_backend(self, icon=None, item=None) -> None:
-        """Handler para parar backend."""
-        self.logger.debug("Menu: Parar Backend")
-        if "stop_backend" in self._callbacks:
-            self._callbacks["stop_backend"]()
-
-    def _on_menu_backend_status(self, icon=None, item=None) -> None:
-        """Handler para status do backend."""
-        self.logger.debug("Menu: Status Backend")
-        if "backend_status" in self._callbacks:
-            self._callbacks["backend_status"]()
-
-    def _on_menu_settings(self, icon=None, item=None) -> None:
-        """Handler para configuracoes."""
-        self.logger.debug("Menu: Configuracoes")
-        if self.on_settings:
-            self.on_settings()
-        if "settings" in self._callbacks:
-            self._callbacks["settings"]()
-
-    def _on_menu_quit(self, icon=None, item=None) -> None:
-        """Handler para sair."""
-        self.logger.debug("Menu: Sair")
-        self.stop()
-        if self.on_quit:
-            self.on_quit()
-        if "quit" in self._callbacks:
-            self._callbacks["quit"]()
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("Erro ao atualizar icone: %s", e)
+
+    def _dispatch(self, event: str) -> None:
+        """
+        Executa a acao de um item do menu.
+
+        Args:
+            event: Nome do evento (chave de _MENU_DISPATCH)
+        """
+        label, attr = self._MENU_DISPATCH[event]
+        self.logger.debug("Menu: %s", label)
+
+        # Sair encerra o icone antes de notificar a aplicacao
+        if event == "quit":
+            self.stop()
+
+        direct = getattr(self, attr) if attr else None
+        if direct:
+            direct()
+
+        callback = self._callbacks.get(event)
+        if callback:
+            callback()
+
+    def _make_menu_handler(self, event: str) -> Callable[[Any, Any], None]:
+        """
+        Cria o handler pystray de um evento do menu.
+        O pystray inspeciona o numero de argumentos da acao, por isso o
+        handler e uma funcao com assinatura (icon, item).
+
+        Args:
+            event: Nome do evento
+
+        Returns:
+            Handler para o MenuItem
+        """
+        def handler(icon, item) -> None:
+            self._dispatch(event)
+        return handler
+
+    def set_loop(self, loop: Optional[asyncio.AbstractEventLoop]) -> None:
+        """
+        Define o event loop onde as atualizacoes do icone sao executadas.
+
+        Args:
+            loop: Event loop asyncio da aplicacao
+        """
+        self._loop = loop
+
+    def _request_update(self) -> None:
+        """Atualiza o icone, sempre a partir da thread do event loop (se definido)."""
+        loop = self._loop
+        if loop is None or loop.is_closed():
+            self._update_icon()
+            return
+
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+
+        if running is loop:
+            self._update_icon()
+        else:
+            loop.call_soon_threadsafe(self._update_icon)
 
     def register_callback(self, event: str, callback: Callable) -> None:
         """
@@ -369,18 +474,28 @@ class SystemTrayIcon(LoggerMixin):
             return True
 
         try:
-            # Cria icone
+            # Pre-desenha os icones de todos os status
+            for tray_status in TrayStatus:
+                self._create_icon_image(tray_status)
+
+            # Cria icone e menu (o menu e reaproveitado em todas as atualizacoes)
             image = self._create_icon_image()
             if not image:
                 self.logger.error("Nao foi possivel criar imagem do icone")
                 return False
 
+            if self._menu is None:
+                self._menu = self._create_menu()
+
+            import pystray
+
             self._icon = pystray.Icon(
                 name="skycamos",
                 icon=image,
                 title=self._tooltip,
-                menu=self._create_menu()
+                menu=self._menu
             )
+            self._last_render_key = self._render_key()
 
             # Inicia em thread separada
             self._running = True
@@ -408,9 +523,10 @@ class SystemTrayIcon(LoggerMixin):
             try:
                 self._icon.stop()
             except Exception as e:
-                self.logger.debug(f"Erro ao parar icone: {e}")
+                self.logger.debug("Erro ao parar icone: %s", e)
 
         self._icon = None
+        self._last_render_key = None
         self.logger.info("System tray parado")
 
     def show_notification(
@@ -435,10 +551,11 @@ class SystemTrayIcon(LoggerMixin):
 
         try:
             self._icon.notify(message, title)
-            self.logger.debug(f"Notificacao: {title}")
+            self.logger.debug("Notificacao: %s", title)
             return True
         except Exception as e:
-            self.logger.debug(f"Erro ao exibir notificacao: {e}")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("Erro ao exibir notificacao: %s", e)
             return False
 
     def update_status(
@@ -458,41 +575,33 @@ class SystemTrayIcon(LoggerMixin):
         self._backend_running = backend_running
         self._camera_count = camera_count
 
-        # Determina status
+        # Determina status (tooltip antes do status, para o setter ja desenhar o estado final)
         if error_message:
-            self.status = TrayStatus.ERROR
             self._tooltip = f"SkyCamOS - ERRO: {error_message}"
+            self.status = TrayStatus.ERROR
         elif not backend_running:
-            self.status = TrayStatus.OFFLINE
             self._tooltip = "SkyCamOS - Backend offline"
+            self.status = TrayStatus.OFFLINE
         elif camera_count == 0:
-            self.status = TrayStatus.WARNING
             self._tooltip = "SkyCamOS - Nenhuma camera conectada"
+            self.status = TrayStatus.WARNING
         else:
-            self.status = TrayStatus.OK
             self._tooltip = f"SkyCamOS - {camera_count} camera(s) online"
+            self.status = TrayStatus.OK
 
-        self._update_icon()
+        # Cobre mudancas que nao alteram o status (ex.: numero de cameras)
+        self._request_update()
 
-    def update_from_process_state(self, state: ProcessState) -> None:
+    def update_from_process_state(self, state: "ProcessState") -> None:
         """
         Atualiza status baseado no estado do processo.
 
         Args:
             state: Estado do processo backend
         """
-        state_map = {
-            ProcessState.RUNNING: TrayStatus.OK,
-            ProcessState.STARTING: TrayStatus.WARNING,
-            ProcessState.STOPPING: TrayStatus.WARNING,
-            ProcessState.RESTARTING: TrayStatus.WARNING,
-            ProcessState.CRASHED: TrayStatus.ERROR,
-            ProcessState.STOPPED: TrayStatus.OFFLINE
-        }
-
-        self._backend_running = state == ProcessState.RUNNING
-        self.status = state_map.get(state, TrayStatus.OFFLINE)
-        self._update_icon()
+        self._backend_running = state.name == "RUNNING"
+        self.status = self._PROCESS_STATE_MAP.get(state.name, TrayStatus.OFFLINE)
+        self._request_update()
 
 
 class TrayManager(LoggerMixin):
@@ -534,6 +643,7 @@ class TrayManager(LoggerMixin):
             on_open=on_open,
             on_quit=on_quit
         )
+        self._tray.set_loop(loop)
 
         return self._tray.is_available
 
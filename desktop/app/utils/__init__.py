@@ -7,18 +7,26 @@ Modulo de utilitarios para o Desktop Manager
 from .logger import get_logger, setup_logging
 from .network import (
     get_local_ip,
+    refresh_local_ip,
     get_network_interfaces,
+    invalidate_interface_cache,
     is_port_available,
     find_available_port,
-    ping_host
+    find_available_port_async,
+    ping_host,
+    ping_many
 )
 
 __all__ = [
     'get_logger',
     'setup_logging',
     'get_local_ip',
+    'refresh_local_ip',
     'get_network_interfaces',
+    'invalidate_interface_cache',
     'is_port_available',
     'find_available_port',
-    'ping_host'
+    'find_available_port_async',
+    'ping_host',
+    'ping_many'
 ]
@@ -6,16 +6,26 @@ Sistema de logging configurado para o Desktop Manager
 
 import os
 import sys
+import atexit
+import queue
 import logging
-from logging.handlers import RotatingFileHandler, TimedRotatingFileHandler
+from logging.handlers import (
+    RotatingFileHandler,
+    QueueHandler,
+    QueueListener
+)
 from datetime import datetime
+from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional, Set
 
 
 # Diretorio padrao para logs
 DEFAULT_LOG_DIR = Path.home() / ".skycamos" / "logs"
 
+# Diretorios de log ja criados neste processo
+_MKDIR_DONE: Set[Path] = set()
+
 # Formato padrao dos logs
 DEFAULT_FORMAT = "%(asctime)s | %(levelname)-8s | %(name)-20s | %(message)s"
 DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
@@ -29,6 +39,40 @@ LOG_LEVELS = {
     "CRITICAL": logging.CRITICAL
 }
 
+# Logger base da aplicacao (todos os loggers de get_logger sao filhos dele)
+APP_LOGGER_NAME = "skycamos"
+
+# Suporte a cores no console, verificado uma vez no import (FORCE_COLOR=1 forca)
+_STDOUT_IS_TTY = sys.stdout.isatty() or os.environ.get("FORCE_COLOR") == "1"
+
+# Formatter simples compartilhado por todos os handlers sem cor
+_SHARED_FMT = logging.Formatter(DEFAULT_FORMAT, DATE_FORMAT)
+
+# Listener que grava os arquivos de log em uma thread propria
+_LISTENER: Dict[str, Optional[QueueListener]] = {"value": None}
+
+
+def _stop_listener() -> None:
+    """Para o listener de arquivos, gravando os registros pendentes."""
+    listener = _LISTENER["value"]
+    if listener is None:
+        return
+
+    listener.stop()
+    for handler in listener.handlers:
+        handler.close()
+    _LISTENER["value"] = None
+
+
+atexit.register(_stop_listener)
+
+
+def _ensure_log_dir(log_path: Path) -> None:
+    """Cria o diretorio de logs apenas na primeira vez em que e usado."""
+    if log_path not in _MKDIR_DONE:
+        log_path.mkdir(parents=True, exist_ok=True)
+        _MKDIR_DONE.add(log_path)
+
 
 class ColoredFormatter(logging.Formatter):
     """
@@ -48,14 +92,16 @@ class ColoredFormatter(logging.Formatter):
 
     def format(self, record: logging.LogRecord) -> str:
         """Formata o registro de log com cores."""
-        # Adiciona cor baseada no nivel
-        color = self.COLORS.get(record.levelno, self.RESET)
-
         # Formata a mensagem original
         message = super().format(record)
 
+        # Niveis sem cor definida saem sem codigos ANSI
+        color = self.COLORS.get(record.levelno)
+        if color is None:
+            return message
+
         # Retorna com cor (apenas no console)
-        return f"{color}{message}{self.RESET}"
+        return color + message + self.RESET
 
 
 def setup_logging(
@@ -73,43 +119,54 @@ def setup_logging(
         log_dir: Diretorio para salvar os arquivos de log
         log_level: Nivel de log (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         console_output: Se deve exibir logs no console
-        file_output: Se deve salvar logs em arquivo
+        file_output: Se deve salvar logs em arquivo (gravados em thread separada)
         max_file_size_mb: Tamanho maximo de cada arquivo de log em MB
         backup_count: Numero de arquivos de backup a manter
     """
     # Define diretorio de logs
     log_path = log_dir or DEFAULT_LOG_DIR
-    log_path.mkdir(parents=True, exist_ok=True)
+    _ensure_log_dir(log_path)
 
     # Obtem nivel de log
     level = LOG_LEVELS.get(log_level.upper(), logging.INFO)
 
-    # Configura o logger raiz
+    # Os handlers ficam no logger da aplicacao, sem propagar para o raiz:
+    # logs de bibliotecas de terceiros nao passam pelos arquivos de log
+    app_logger = logging.getLogger(APP_LOGGER_NAME)
+    app_logger.setLevel(level)
+    app_logger.propagate = False
+
+    # O logger raiz fica no nivel padrao (WARNING)
     root_logger = logging.getLogger()
-    root_logger.setLevel(level)
+    root_logger.setLevel(logging.WARNING)
 
     # Remove handlers existentes
-    for handler in root_logger.handlers[:]:
-        root_logger.removeHandler(handler)
+    for target in (app_logger, root_logger):
+        for handler in target.handlers[:]:
+            target.removeHandler(handler)
+    _stop_listener()
 
     # Handler para console
     if console_output:
-        console_handler = logging.StreamHandler(sys.stdout)
-        console_handler.setLevel(level)
-
         # Usa formatter colorido se o terminal suportar
-        if sys.stdout.isatty():
-            console_handler.setFormatter(
-                ColoredFormatter(DEFAULT_FORMAT, DATE_FORMAT)
-            )
+        if _STDOUT_IS_TTY:
+            console_formatter = ColoredFormatter(DEFAULT_FORMAT, DATE_FORMAT)
         else:
-            console_handler.setFormatter(
-                logging.Formatter(DEFAULT_FORMAT, DATE_FORMAT)
-            )
+            console_formatter = _SHARED_FMT
 
-        root_logger.addHandler(console_handler)
+        console_handler = logging.StreamHandler(sys.stdout)
+        console_handler.setLevel(level)
+        console_handler.setFormatter(console_formatter)
+        app_logger.addHandler(console_handler)
 
-    # Handler para arquivo
+        # Avisos de bibliotecas de terceiros continuam no console
+        root_console_handler = logging.StreamHandler(sys.stdout)
+        root_console_handler.setLevel(logging.WARNING)
+        root_console_handler.setFormatter(console_formatter)
+        root_logger.addHandler(root_console_handler)
+
+    # Handlers para arquivo: gravados pelo QueueListener em background,
+    # o logger da aplicacao apenas enfileira os registros
     if file_output:
         # Arquivo principal com rotacao por tamanho
         log_file = log_path / "skycamos.log"
@@ -120,10 +177,7 @@ def setup_logging(
             encoding="utf-8"
         )
         file_handler.setLevel(level)
-        file_handler.setFormatter(
-            logging.Formatter(DEFAULT_FORMAT, DATE_FORMAT)
-        )
-        root_logger.addHandler(file_handler)
+        file_handler.setFormatter(_SHARED_FMT)
 
         # Arquivo separado para erros
         error_file = log_path / "skycamos_errors.log"
@@ -134,22 +188,34 @@ def setup_logging(
             encoding="utf-8"
         )
         error_handler.setLevel(logging.ERROR)
-        error_handler.setFormatter(
-            logging.Formatter(DEFAULT_FORMAT, DATE_FORMAT)
+        error_handler.setFormatter(_SHARED_FMT)
+
+        log_queue: queue.Queue = queue.Queue(-1)
+        listener = QueueListener(
+            log_queue,
+            file_handler,
+            error_handler,
+            respect_handler_level=True
         )
-        root_logger.addHandler(error_handler)
+        listener.start()
+        _LISTENER["value"] = listener
+        app_logger.addHandler(QueueHandler(log_queue))
 
-    # Log inicial
-    root_logger.info("=" * 60)
-    root_logger.info("SkyCamOS Desktop Manager - Logging inicializado")
-    root_logger.info(f"Nivel de log: {log_level.upper()}")
-    root_logger.info(f"Diretorio de logs: {log_path}")
-    root_logger.info("=" * 60)
+    # Log inicial (um unico registro para o banner inteiro)
+    app_logger.info("\n".join([
+        "=" * 60,
+        "SkyCamOS Desktop Manager - Logging inicializado",
+        f"Nivel de log: {log_level.upper()}",
+        f"Diretorio de logs: {log_path}",
+        "=" * 60
+    ]))
 
 
+@lru_cache(maxsize=None)
 def get_logger(name: str) -> logging.Logger:
     """
     Obtem um logger com o nome especificado.
+    O resultado e memorizado por nome.
 
     Args:
         name: Nome do modulo/componente
@@ -157,7 +223,7 @@ def get_logger(name: str) -> logging.Logger:
     Returns:
         Logger configurado
     """
-    return logging.getLogger(f"skycamos.{name}")
+    return logging.getLogger(f"{APP_LOGGER_NAME}.{name}")
 
 
 class LoggerMixin:
@@ -166,12 +232,10 @@ class LoggerMixin:
     Uso: class MinhaClasse(LoggerMixin): ...
     """
 
-    @property
+    @cached_property
     def logger(self) -> logging.Logger:
-        """Retorna o logger para esta classe."""
-        if not hasattr(self, "_logger"):
-            self._logger = get_logger(self.__class__.__name__)
-        return self._logger
+        """Retorna o logger para esta classe (resolvido uma vez por instancia)."""
+        return get_logger(type(self).__name__)
 
 
 def log_exception(logger: logging.Logger, exc: Exception, message: str = "") -> None:
@@ -184,9 +248,9 @@ def log_exception(logger: logging.Logger, exc: Exception, message: str = "") ->
         message: Mensagem adicional
     """
     if message:
-        logger.error(f"{message}: {type(exc).__name__}: {exc}")
+        logger.error("%s: %s: %s", message, type(exc).__name__, exc)
     else:
-        logger.error(f"{type(exc).__name__}: {exc}")
+        logger.error("%s: %s", type(exc).__name__, exc)
     logger.debug("Stack trace:", exc_info=True)
 
 
@@ -202,7 +266,7 @@ def create_session_log(log_dir: Optional[Path] = None) -> Path:
         Caminho para o arquivo de log da sessao
     """
     log_path = log_dir or DEFAULT_LOG_DIR
-    log_path.mkdir(parents=True, exist_ok=True)
+    _ensure_log_dir(log_path)
 
     # Nome do arquivo com timestamp
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -211,11 +275,9 @@ def create_session_log(log_dir: Optional[Path] = None) -> Path:
     # Cria handler para a sessao
     session_handler = logging.FileHandler(session_file, encoding="utf-8")
     session_handler.setLevel(logging.DEBUG)
-    session_handler.setFormatter(
-        logging.Formatter(DEFAULT_FORMAT, DATE_FORMAT)
-    )
+    session_handler.setFormatter(_SHARED_FMT)
 
-    # Adiciona ao logger raiz
-    logging.getLogger().addHandler(session_handler)
+    # Adiciona ao logger da aplicacao
+    logging.getLogger(APP_LOGGER_NAME).addHandler(session_handler)
 
     return session_file
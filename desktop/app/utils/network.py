@@ -4,18 +4,128 @@ SkyCamOS Desktop Manager - Network Utils
 Utilitarios de rede para descoberta e comunicacao
 """
 
+import os
+import sys
+import ctypes
+import time
+import errno
 import socket
+import selectors
 import asyncio
+import threading
 import subprocess
 import platform
-from typing import List, Dict, Optional, Tuple
+import array
+import struct
+import itertools
+from typing import Any, Iterator, List, Dict, Optional, Tuple
 from dataclasses import dataclass
 import ipaddress
+from functools import lru_cache
 
 from .logger import get_logger
 
 logger = get_logger("network")
 
+# Timeout do teste de conexao em is_port_available (segundos)
+PORT_CHECK_TIMEOUT = 0.05
+
+# Empacotamento de IPv4 como inteiro (ordem de rede)
+_IPV4_STRUCT = struct.Struct("!I")
+
+# ICMP Echo: tipos, cabecalho (tipo, codigo, checksum, id, seq) e payload
+_ICMP_ECHO_REQUEST = 8
+_ICMP_ECHO_REPLY = 0
+_ICMP_HEADER = struct.Struct("!BBHHH")
+_ICMP_PAYLOAD = b"SkyCamOS-ping..."
+_ICMP_IDENT = os.getpid() & 0xFFFF
+_ICMP_SEQ = itertools.count(1)
+
+# Tipo de socket ICMP disponivel (descoberto no primeiro ping)
+_ICMP_STATE: Dict[str, Any] = {"checked": False, "type": None}
+
+# Varredura SYN sem estado: cabecalho TCP, flags e segredo dos cookies
+_TCP_HEADER = struct.Struct("!HHIIBBHHH")
+_TCP_REPLY = struct.Struct("!HHIIBB")
+_TCP_SYN = 0x02
+_TCP_SYN_ACK = 0x12
+_SYN_SECRET = int.from_bytes(os.urandom(8), "big")
+_SYN_SRC_PORT = 40000 + _SYN_SECRET % 20000
+
+# Hosts locais testados via bind em vez de conexao
+_LOCAL_BIND_HOSTS = frozenset({"", "localhost", "0.0.0.0", "127.0.0.1"})
+
+_IS_WINDOWS = platform.system().lower() == "windows"
+
+# Flags de interface (net/if.h) e layout de sockaddr para getifaddrs
+_IFF_UP = 0x1
+_IFF_BROADCAST = 0x2
+_SOCKADDR_HAS_LEN = sys.platform == "darwin" or "bsd" in sys.platform
+
+# Seletor por thread usado em is_port_available
+_SELECTORS = threading.local()
+
+# Codigos de connect_ex para conexao nao bloqueante em andamento
+_CONNECT_PENDING = frozenset({
+    errno.EINPROGRESS,
+    errno.EWOULDBLOCK,
+    getattr(errno, "WSAEWOULDBLOCK", errno.EWOULDBLOCK)
+})
+
+# Timeout de cada teste de porta na busca paralela (segundos)
+PORT_PROBE_TIMEOUT = 0.1
+
+# Portas testadas por vez em find_available_port_async
+PORT_SEARCH_CHUNK = 32
+
+# Tempo de validade do IP local em cache (segundos)
+LOCAL_IP_CACHE_TTL = 30.0
+
+# Tempo de validade das resolucoes de hostname em cache (segundos)
+RESOLVE_CACHE_TTL = 60.0
+
+# Cache do IP local principal
+_LOCAL_IP_CACHE: Dict[str, Any] = {"ts": 0.0, "ip": None}
+
+# Tempo de validade da lista de interfaces em cache (segundos)
+INTERFACE_CACHE_TTL = 5.0
+
+# Cache da lista de interfaces de rede
+# ("gen" muda a cada nova consulta ao sistema)
+_IFACE_CACHE: Dict[str, Any] = {"ts": 0.0, "value": None, "gen": 0}
+
+# Enderecos de broadcast calculados para uma geracao do cache de interfaces
+_BCAST_CACHE: Dict[str, Any] = {"gen": -1, "value": []}
+
+# Hostname da maquina local (raramente muda durante a execucao)
+_HOSTNAME_CACHE: Dict[str, Any] = {"value": socket.gethostname()}
+
+# Maximo de conexoes simultaneas em varreduras (limita descritores abertos)
+MAX_CONCURRENT_PROBES = 256
+
+
+def install_fast_event_loop() -> bool:
+    """
+    Define a politica de event loop usada pelos utilitarios de rede.
+    Usa uvloop quando instalado (fora do Windows); no Windows usa o
+    WindowsSelectorEventLoopPolicy. Deve ser chamado antes de asyncio.run.
+
+    Returns:
+        True se o uvloop foi ativado
+    """
+    if _IS_WINDOWS:
+        asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
+        return False
+
+    try:
+        import uvloop
+    except ImportError:
+        return False
+
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    logger.debug("uvloop ativado como event loop")
+    return True
+
 
 @dataclass
 class NetworkInterface:
@@ -32,17 +142,25 @@ def get_local_ip() -> str:
     """
     Obtem o IP local principal da maquina.
     Tenta conectar a um servidor externo para determinar a interface correta.
+    O resultado fica em cache por LOCAL_IP_CACHE_TTL segundos.
 
     Returns:
         IP local como string
     """
+    now = time.monotonic()
+    cached = _LOCAL_IP_CACHE["ip"]
+    if cached is not None and now - _LOCAL_IP_CACHE["ts"] < LOCAL_IP_CACHE_TTL:
+        return cached
+
     try:
         # Cria socket UDP (nao precisa realmente conectar)
         with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
             # Tenta "conectar" a um IP externo
             s.connect(("8.8.8.8", 80))
             local_ip = s.getsockname()[0]
-            logger.debug(f"IP local detectado: {local_ip}")
+            logger.debug("IP local detectado: %s", local_ip)
+            _LOCAL_IP_CACHE["ip"] = local_ip
+            _LOCAL_IP_CACHE["ts"] = now
             return local_ip
     except Exception as e:
         logger.warning(f"Erro ao obter IP local: {e}")
@@ -50,13 +168,170 @@ def get_local_ip() -> str:
         return "127.0.0.1"
 
 
+def refresh_local_ip() -> str:
+    """
+    Descarta o IP local em cache e detecta novamente.
+    Util apos suspensao/retomada ou mudanca de rede.
+
+    Returns:
+        IP local como string
+    """
+    _LOCAL_IP_CACHE["ip"] = None
+    _LOCAL_IP_CACHE["ts"] = 0.0
+    return get_local_ip()
+
+
 def get_network_interfaces() -> List[NetworkInterface]:
     """
     Lista todas as interfaces de rede disponiveis.
+    O resultado fica em cache por INTERFACE_CACHE_TTL segundos.
+
+    Returns:
+        Lista de NetworkInterface
+    """
+    return list(_cached_interfaces())
+
+
+def _cached_interfaces() -> List[NetworkInterface]:
+    """
+    Retorna a lista de interfaces em cache, consultando o sistema se expirou.
+    A lista retornada e a propria lista do cache (nao modificar).
+
+    Returns:
+        Lista de NetworkInterface
+    """
+    now = time.monotonic()
+    cached = _IFACE_CACHE["value"]
+    if cached is not None and now - _IFACE_CACHE["ts"] < INTERFACE_CACHE_TTL:
+        return cached
+
+    interfaces = _list_network_interfaces()
+    _IFACE_CACHE["value"] = interfaces
+    _IFACE_CACHE["ts"] = now
+    _IFACE_CACHE["gen"] += 1
+    return interfaces
+
+
+def invalidate_interface_cache() -> None:
+    """Descarta a lista de interfaces em cache (ex.: apos mudanca de rede)."""
+    _IFACE_CACHE["value"] = None
+    _IFACE_CACHE["ts"] = 0.0
+
+
+class _IfAddrs(ctypes.Structure):
+    """struct ifaddrs (mesmo layout no Linux e no macOS)."""
+
+
+_IfAddrs._fields_ = [
+    ("ifa_next", ctypes.POINTER(_IfAddrs)),
+    ("ifa_name", ctypes.c_char_p),
+    ("ifa_flags", ctypes.c_uint),
+    ("ifa_addr", ctypes.c_void_p),
+    ("ifa_netmask", ctypes.c_void_p),
+    ("ifa_broadaddr", ctypes.c_void_p),
+    ("ifa_data", ctypes.c_void_p)
+]
+
+
+def _sockaddr_ipv4(ptr: Optional[int]) -> Optional[str]:
+    """
+    Le um endereco IPv4 de um ponteiro para struct sockaddr.
+
+    Args:
+        ptr: Endereco da struct sockaddr (ou None)
+
+    Returns:
+        IP como string, ou None se nulo ou de outra familia
+    """
+    if not ptr:
+        return None
+    raw = ctypes.string_at(ptr, 8)
+    # BSD/macOS: sa_len (1 byte) + sa_family (1 byte); Linux: sa_family (2 bytes)
+    family = raw[1] if _SOCKADDR_HAS_LEN else int.from_bytes(raw[:2], sys.byteorder)
+    if family != socket.AF_INET:
+        return None
+    return socket.inet_ntoa(raw[4:8])
+
+
+@lru_cache(maxsize=1)
+def _load_libc() -> Optional[ctypes.CDLL]:
+    """
+    Carrega a libc do processo (uma unica vez).
+
+    Returns:
+        Biblioteca carregada ou None
+    """
+    try:
+        return ctypes.CDLL(None, use_errno=True)
+    except OSError:
+        return None
+
+
+def _getifaddrs_interfaces() -> Optional[List[NetworkInterface]]:
+    """
+    Lista as interfaces IPv4 chamando getifaddrs da libc diretamente.
+
+    Returns:
+        Lista de NetworkInterface, ou None se getifaddrs nao estiver disponivel
+    """
+    if _IS_WINDOWS:
+        return None
+
+    libc = _load_libc()
+    if libc is None or not hasattr(libc, "getifaddrs"):
+        return None
+    getifaddrs = libc.getifaddrs
+    freeifaddrs = libc.freeifaddrs
+
+    head = ctypes.POINTER(_IfAddrs)()
+    if getifaddrs(ctypes.byref(head)) != 0:
+        logger.debug("getifaddrs falhou: errno %d", ctypes.get_errno())
+        return None
+
+    interfaces = []
+    try:
+        node = head
+        while node:
+            entry = node.contents
+            node = entry.ifa_next
+
+            ip = _sockaddr_ipv4(entry.ifa_addr)
+            if ip is None:
+                continue
+
+            flags = entry.ifa_flags
+            broadcast = _sockaddr_ipv4(entry.ifa_broadaddr) if flags & _IFF_BROADCAST else None
+            interfaces.append(NetworkInterface(
+                name=entry.ifa_name.decode(errors="replace"),
+                ip_address=ip,
+                netmask=_sockaddr_ipv4(entry.ifa_netmask) or "255.255.255.0",
+                broadcast=broadcast,
+                is_up=bool(flags & _IFF_UP),
+                is_loopback=ip.startswith("127.")
+            ))
+    finally:
+        freeifaddrs(head)
+
+    return interfaces
+
+
+def _list_network_interfaces() -> List[NetworkInterface]:
+    """
+    Consulta o sistema pelas interfaces de rede, sem cache.
+    Usa getifaddrs diretamente (Linux/macOS) e psutil como alternativa.
 
     Returns:
         Lista de NetworkInterface
     """
+    try:
+        interfaces = _getifaddrs_interfaces()
+    except Exception as e:
+        logger.debug("Erro ao consultar getifaddrs: %s", e)
+        interfaces = None
+
+    if interfaces is not None:
+        return interfaces
+
     interfaces = []
 
     try:
@@ -66,13 +341,15 @@ def get_network_interfaces() -> List[NetworkInterface]:
         addrs = psutil.net_if_addrs()
         stats = psutil.net_if_stats()
 
+        af_inet = socket.AF_INET
         for iface_name, addr_list in addrs.items():
+            # Estado da interface nao depende do endereco
+            iface_stats = stats.get(iface_name)
+            is_up = iface_stats.isup if iface_stats else False
+
             for addr in addr_list:
                 # Apenas IPv4
-                if addr.family == socket.AF_INET:
-                    is_up = stats.get(iface_name, None)
-                    is_up = is_up.isup if is_up else False
-
+                if addr.family == af_inet:
                     interface = NetworkInterface(
                         name=iface_name,
                         ip_address=addr.address,
@@ -103,9 +380,69 @@ def get_network_interfaces() -> List[NetworkInterface]:
     return interfaces
 
 
+def _thread_selector() -> selectors.BaseSelector:
+    """
+    Retorna o seletor reaproveitado pela thread atual.
+    Evita criar (e fechar) um descritor epoll/kqueue a cada teste de porta.
+
+    Returns:
+        Seletor da thread
+    """
+    selector = getattr(_SELECTORS, "selector", None)
+    if selector is None:
+        selector = selectors.DefaultSelector()
+        _SELECTORS.selector = selector
+    return selector
+
+
+def _is_local_bind_host(host: str) -> bool:
+    """
+    Verifica se o host e loopback ou wildcard (porta testavel via bind).
+
+    Args:
+        host: Host a verificar
+
+    Returns:
+        True se a porta pode ser testada com bind local
+    """
+    if host in _LOCAL_BIND_HOSTS:
+        return True
+    try:
+        address = ipaddress.ip_address(host)
+    except ValueError:
+        return False
+    return address.version == 4 and (address.is_loopback or address.is_unspecified)
+
+
+def _bind_probe(port: int, host: str) -> Optional[bool]:
+    """
+    Testa a porta tentando fazer bind nela, sem conexao e sem timeout.
+
+    Args:
+        port: Numero da porta
+        host: Host local (loopback ou wildcard)
+
+    Returns:
+        True se livre, False se em uso, None se o teste nao foi conclusivo
+    """
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+        # Mesmo comportamento do servidor (ignora conexoes em TIME_WAIT).
+        # No Windows SO_REUSEADDR permitiria bind em porta ocupada.
+        if not _IS_WINDOWS:
+            s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        try:
+            s.bind((host, port))
+        except OSError as e:
+            if e.errno in (errno.EADDRINUSE, errno.EACCES) or getattr(e, "winerror", None) == 10048:
+                return False
+            return None
+    return True
+
+
 def is_port_available(port: int, host: str = "127.0.0.1") -> bool:
     """
     Verifica se uma porta esta disponivel para uso.
+    Para hosts locais usa bind; para hosts remotos tenta conectar.
 
     Args:
         port: Numero da porta
@@ -114,21 +451,93 @@ def is_port_available(port: int, host: str = "127.0.0.1") -> bool:
     Returns:
         True se a porta esta disponivel
     """
+    if _is_local_bind_host(host):
+        available = _bind_probe(port, host)
+        if available is not None:
+            logger.debug("Porta %d em %s: %s", port, host, "disponivel" if available else "em uso")
+            return available
+
     try:
         with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-            s.settimeout(1)
+            # Conexao nao bloqueante: espera no maximo PORT_CHECK_TIMEOUT
+            s.setblocking(False)
             result = s.connect_ex((host, port))
+            if result in _CONNECT_PENDING:
+                selector = _thread_selector()
+                selector.register(s, selectors.EVENT_WRITE)
+                try:
+                    if selector.select(timeout=PORT_CHECK_TIMEOUT):
+                        result = s.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR)
+                finally:
+                    selector.unregister(s)
+
+            # Qualquer resultado diferente de 0 (recusada, timeout) = livre
             available = result != 0
-            logger.debug(f"Porta {port} em {host}: {'disponivel' if available else 'em uso'}")
+            logger.debug("Porta %d em %s: %s", port, host, "disponivel" if available else "em uso")
             return available
     except Exception as e:
         logger.error(f"Erro ao verificar porta {port}: {e}")
         return False
 
 
+async def _is_port_in_use(port: int, host: str, timeout: float) -> bool:
+    """
+    Verifica de forma assincrona se ha algo escutando na porta.
+
+    Args:
+        port: Numero da porta
+        host: Host a verificar
+        timeout: Timeout da conexao em segundos
+
+    Returns:
+        True se a conexao foi aceita (porta em uso)
+    """
+    if _is_local_bind_host(host):
+        available = _bind_probe(port, host)
+        if available is not None:
+            return not available
+    return await scan_port(host, port, timeout)
+
+
+async def find_available_port_async(
+    start_port: int = 8000,
+    end_port: int = 9000,
+    host: str = "127.0.0.1",
+    timeout: float = PORT_PROBE_TIMEOUT
+) -> Optional[int]:
+    """
+    Encontra uma porta disponivel em um range, testando as portas em paralelo.
+    As portas sao testadas em blocos de PORT_SEARCH_CHUNK, parando no primeiro
+    bloco com porta livre.
+
+    Args:
+        start_port: Porta inicial do range
+        end_port: Porta final do range
+        host: Host a verificar
+        timeout: Timeout de cada teste em segundos
+
+    Returns:
+        Menor porta disponivel ou None
+    """
+    for chunk_start in range(start_port, end_port + 1, PORT_SEARCH_CHUNK):
+        ports = range(chunk_start, min(chunk_start + PORT_SEARCH_CHUNK, end_port + 1))
+        results = await asyncio.gather(*[
+            _is_port_in_use(port, host, timeout) for port in ports
+        ])
+
+        for port, in_use in zip(ports, results, strict=True):
+            if not in_use:
+                logger.info("Porta disponivel encontrada: %d", port)
+                return port
+
+    logger.warning("Nenhuma porta disponivel no range %d-%d", start_port, end_port)
+    return None
+
+
 def find_available_port(start_port: int = 8000, end_port: int = 9000, host: str = "127.0.0.1") -> Optional[int]:
     """
     Encontra uma porta disponivel em um range.
+    Dentro de um event loop em execucao use find_available_port_async.
 
     Args:
         start_port: Porta inicial do range
@@ -138,18 +547,193 @@ def find_available_port(start_port: int = 8000, end_port: int = 9000, host: str
     Returns:
         Numero da porta disponivel ou None
     """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(find_available_port_async(start_port, end_port, host))
+
+    # Chamado de dentro de um loop: asyncio.run nao pode ser usado
     for port in range(start_port, end_port + 1):
         if is_port_available(port, host):
-            logger.info(f"Porta disponivel encontrada: {port}")
+            logger.info("Porta disponivel encontrada: %d", port)
             return port
 
-    logger.warning(f"Nenhuma porta disponivel no range {start_port}-{end_port}")
+    logger.warning("Nenhuma porta disponivel no range %d-%d", start_port, end_port)
     return None
 
 
-async def ping_host(host: str, timeout: float = 2.0) -> Tuple[bool, float]:
+def _icmp_checksum(data: bytes) -> int:
     """
-    Verifica se um host esta acessivel via ping.
+    Calcula o checksum ICMP (complemento de um da soma de palavras de 16 bits).
+
+    Args:
+        data: Pacote ICMP com o campo de checksum zerado
+
+    Returns:
+        Checksum de 16 bits
+    """
+    if len(data) % 2:
+        data += b"\x00"
+    total = sum(array.array("H", data))
+    total = (total >> 16) + (total & 0xFFFF)
+    total += total >> 16
+    # array("H") usa a ordem nativa; htons converte para ordem de rede
+    return socket.htons(~total & 0xFFFF)
+
+
+def _build_echo_request(ident: int, seq: int) -> bytes:
+    """
+    Monta um pacote ICMP Echo Request.
+
+    Args:
+        ident: Identificador do pacote
+        seq: Numero de sequencia
+
+    Returns:
+        Pacote pronto para envio
+    """
+    header = _ICMP_HEADER.pack(_ICMP_ECHO_REQUEST, 0, 0, ident, seq)
+    checksum = _icmp_checksum(header + _ICMP_PAYLOAD)
+    return _ICMP_HEADER.pack(_ICMP_ECHO_REQUEST, 0, checksum, ident, seq) + _ICMP_PAYLOAD
+
+
+def _open_icmp_socket() -> Optional[socket.socket]:
+    """
+    Abre um socket ICMP nao bloqueante.
+    Tenta SOCK_DGRAM (sem privilegios no Linux) e depois SOCK_RAW; o tipo
+    que funcionou (ou a falta de suporte) e lembrado para as proximas chamadas.
+
+    Returns:
+        Socket ICMP ou None se indisponivel
+    """
+    if _IS_WINDOWS or _ICMP_STATE["checked"] and _ICMP_STATE["type"] is None:
+        return None
+
+    sock_types = (_ICMP_STATE["type"],) if _ICMP_STATE["checked"] else (socket.SOCK_DGRAM, socket.SOCK_RAW)
+    for sock_type in sock_types:
+        try:
+            sock = socket.socket(socket.AF_INET, sock_type, socket.IPPROTO_ICMP)
+        except OSError:
+            continue
+        sock.setblocking(False)
+        _ICMP_STATE["checked"] = True
+        _ICMP_STATE["type"] = sock_type
+        return sock
+
+    _ICMP_STATE["checked"] = True
+    _ICMP_STATE["type"] = None
+    logger.debug("Sockets ICMP indisponiveis, usando comando ping")
+    return None
+
+
+def _is_echo_reply(data: bytes, ident: Optional[int], seq: int) -> bool:
+    """
+    Verifica se o pacote recebido e a resposta do nosso Echo Request.
+
+    Args:
+        data: Dados recebidos (com ou sem cabecalho IP)
+        ident: Identificador esperado (None quando o kernel o define)
+        seq: Numero de sequencia esperado
+
+    Returns:
+        True se for a resposta esperada
+    """
+    # Sockets RAW (e DGRAM no macOS) entregam o cabecalho IP junto
+    if data and data[0] >> 4 == 4:
+        data = data[(data[0] & 0x0F) * 4:]
+    if len(data) < _ICMP_HEADER.size:
+        return False
+
+    icmp_type, _, _, reply_ident, reply_seq = _ICMP_HEADER.unpack_from(data)
+    if icmp_type != _ICMP_ECHO_REPLY or reply_seq != seq:
+        return False
+    return ident is None or reply_ident == ident
+
+
+async def _resolve_address(host: str) -> Optional[str]:
+    """
+    Resolve o host uma unica vez para uso em varias sondagens.
+    IPs literais sao retornados sem consultar o resolver. Prefere IPv4,
+    mas aceita hosts que so possuem endereco IPv6.
+
+    Args:
+        host: IP ou hostname
+
+    Returns:
+        IP resolvido, ou None se nem IPv4 nem IPv6 resolverem
+    """
+    try:
+        ipaddress.ip_address(host)
+        return host
+    except ValueError:
+        pass
+
+    try:
+        loop = asyncio.get_running_loop()
+        infos = await loop.getaddrinfo(host, None, type=socket.SOCK_STREAM)
+    except OSError:
+        # Nunca devolve o hostname: connect() o resolveria de forma bloqueante
+        return None
+
+    for info in infos:
+        if info[0] == socket.AF_INET:
+            return info[4][0]
+    for info in infos:
+        if info[0] == socket.AF_INET6:
+            return info[4][0]
+    return None
+
+
+async def _icmp_ping(host: str, timeout: float) -> Optional[Tuple[bool, float]]:
+    """
+    Envia um ICMP Echo diretamente por socket, sem criar processo.
+
+    Args:
+        host: Host a verificar (IP ou hostname)
+        timeout: Timeout em segundos
+
+    Returns:
+        Tupla (acessivel, latencia_ms) ou None se sockets ICMP indisponiveis
+    """
+    sock = _open_icmp_socket()
+    if sock is None:
+        return None
+
+    loop = asyncio.get_running_loop()
+    with sock:
+        try:
+            ip = await _resolve_address(host)
+            if ip is None:
+                return False, 0.0
+            if ":" in ip:
+                # IPv6: o socket ICMP e IPv4, o comando ping trata o endereco
+                return None
+
+            # Em SOCK_DGRAM o kernel substitui o identificador pela porta local
+            seq = next(_ICMP_SEQ) & 0xFFFF
+            ident = _ICMP_IDENT if sock.type == socket.SOCK_RAW else None
+            packet = _build_echo_request(_ICMP_IDENT, seq)
+
+            sock.connect((ip, 0))
+            start_time = loop.time()
+            deadline = start_time + timeout
+            await loop.sock_sendall(sock, packet)
+
+            while True:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    return False, 0.0
+                data = await asyncio.wait_for(loop.sock_recv(sock, 1024), remaining)
+                if _is_echo_reply(data, ident, seq):
+                    return True, (loop.time() - start_time) * 1000
+
+        except (asyncio.TimeoutError, OSError):
+            return False, 0.0
+
+
+async def _subprocess_ping(host: str, timeout: float) -> Tuple[bool, float]:
+    """
+    Executa o comando ping do sistema.
 
     Args:
         host: Host a verificar (IP ou hostname)
@@ -158,33 +742,93 @@ async def ping_host(host: str, timeout: float = 2.0) -> Tuple[bool, float]:
     Returns:
         Tupla (acessivel, latencia_ms)
     """
+    # Comando ping diferente por sistema operacional
+    if _IS_WINDOWS:
+        cmd = ["ping", "-n", "1", "-w", str(int(timeout * 1000)), host]
+    else:
+        cmd = ["ping", "-c", "1", "-W", str(int(timeout)), host]
+
+    # Executa ping (a saida nao e usada, so o codigo de retorno)
+    loop = asyncio.get_running_loop()
+    start_time = loop.time()
+
+    process = await asyncio.create_subprocess_exec(
+        *cmd,
+        stdout=asyncio.subprocess.DEVNULL,
+        stderr=asyncio.subprocess.DEVNULL
+    )
+
     try:
-        # Comando ping diferente por sistema operacional
-        if platform.system().lower() == "windows":
-            cmd = ["ping", "-n", "1", "-w", str(int(timeout * 1000)), host]
+        await asyncio.wait_for(process.wait(), timeout=timeout + 1)
+    except asyncio.TimeoutError:
+        process.kill()
+        await process.wait()
+        return False, 0.0
+
+    latency = (loop.time() - start_time) * 1000  # Em milissegundos
+
+    return process.returncode == 0, latency
+
+
+def make_listen_socket(host: str, port: int, backlog: int = 128) -> socket.socket:
+    """
+    Cria um socket TCP em escuta pronto para varios workers aceitarem em paralelo.
+    Usa SO_REUSEPORT quando disponivel (cada worker pode abrir o seu socket na
+    mesma porta e o kernel distribui as conexoes) e desativa o algoritmo de
+    Nagle nas conexoes aceitas. Pode ser passado para asyncio.start_server(sock=...).
+
+    Args:
+        host: Endereco local para bind
+        port: Porta local
+        backlog: Tamanho da fila de conexoes pendentes
+
+    Returns:
+        Socket em escuta
+    """
+    family = socket.AF_INET6 if ":" in host else socket.AF_INET
+    sock = socket.socket(family, socket.SOCK_STREAM)
+    try:
+        if _IS_WINDOWS:
+            # No Windows SO_REUSEADDR permitiria roubar a porta de outro processo
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_EXCLUSIVEADDRUSE, 1)
         else:
-            cmd = ["ping", "-c", "1", "-W", str(int(timeout)), host]
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            if hasattr(socket, "SO_REUSEPORT"):
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
 
-        # Executa ping
-        start_time = asyncio.get_event_loop().time()
+        # Herdado pelas conexoes aceitas (Linux)
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        if hasattr(socket, "TCP_QUICKACK"):
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_QUICKACK, 1)
 
-        process = await asyncio.create_subprocess_exec(
-            *cmd,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE
-        )
+        sock.bind((host, port))
+        sock.listen(backlog)
+        return sock
 
-        try:
-            await asyncio.wait_for(process.communicate(), timeout=timeout + 1)
-        except asyncio.TimeoutError:
-            process.kill()
-            return False, 0.0
+    except OSError:
+        sock.close()
+        raise
 
-        end_time = asyncio.get_event_loop().time()
-        latency = (end_time - start_time) * 1000  # Em milissegundos
 
-        success = process.returncode == 0
-        logger.debug(f"Ping para {host}: {'OK' if success else 'FALHOU'} ({latency:.1f}ms)")
+async def ping_host(host: str, timeout: float = 2.0) -> Tuple[bool, float]:
+    """
+    Verifica se um host esta acessivel via ping.
+    Usa socket ICMP quando disponivel; senao executa o comando ping.
+
+    Args:
+        host: Host a verificar (IP ou hostname)
+        timeout: Timeout em segundos
+
+    Returns:
+        Tupla (acessivel, latencia_ms)
+    """
+    try:
+        result = await _icmp_ping(host, timeout)
+        if result is None:
+            result = await _subprocess_ping(host, timeout)
+
+        success, latency = result
+        logger.debug("Ping para %s: %s (%.1fms)", host, "OK" if success else "FALHOU", latency)
 
         return success, latency
 
@@ -193,6 +837,92 @@ async def ping_host(host: str, timeout: float = 2.0) -> Tuple[bool, float]:
         return False, 0.0
 
 
+async def ping_many(
+    hosts: List[str],
+    timeout: float = 1.0,
+    concurrency: int = 128
+) -> Dict[str, Tuple[bool, float]]:
+    """
+    Faz ping em varios hosts em paralelo.
+
+    Args:
+        hosts: Lista de hosts (IPs ou hostnames)
+        timeout: Timeout por host em segundos
+        concurrency: Maximo de pings simultaneos
+
+    Returns:
+        Dicionario {host: (acessivel, latencia_ms)}
+    """
+    sem = asyncio.Semaphore(concurrency)
+
+    # Resolve cada hostname uma unica vez antes dos pings
+    unique_hosts = list(dict.fromkeys(hosts))
+    resolved = dict(zip(
+        unique_hosts,
+        await asyncio.gather(*[_resolve_address(host) for host in unique_hosts]),
+        strict=True
+    ))
+
+    async def _ping(host: str) -> Tuple[str, Tuple[bool, float]]:
+        address = resolved[host]
+        if address is None:
+            logger.debug("Ping para %s: FALHOU (hostname nao resolvido)", host)
+            return host, (False, 0.0)
+        async with sem:
+            return host, await ping_host(address, timeout)
+
+    return dict(await asyncio.gather(*[_ping(host) for host in hosts]))
+
+
+def _host_int_range(network: ipaddress.IPv4Network) -> range:
+    """
+    Retorna os hosts da rede como inteiros.
+    Exclui rede e broadcast, exceto em /31 e /32 (mesmo criterio de hosts()).
+
+    Args:
+        network: Rede IPv4
+
+    Returns:
+        Range de enderecos inteiros
+    """
+    base = int(network.network_address)
+    count = network.num_addresses
+    if network.prefixlen >= 31:
+        return range(base, base + count)
+    return range(base + 1, base + count - 1)
+
+
+def _iter_hosts(network: ipaddress.IPv4Network) -> Iterator[str]:
+    """
+    Gera os hosts da rede como strings, sob demanda.
+
+    Args:
+        network: Rede IPv4
+
+    Returns:
+        Iterador de IPs
+    """
+    return map(socket.inet_ntoa, map(_IPV4_STRUCT.pack, _host_int_range(network)))
+
+
+def iter_subnet_range(ip: str, netmask: str = "255.255.255.0") -> Iterator[str]:
+    """
+    Itera pelos IPs de uma subnet sem montar a lista inteira.
+    Indicado para varreduras em subnets grandes (ex.: /16).
+
+    Args:
+        ip: IP base
+        netmask: Mascara de rede
+
+    Returns:
+        Iterador de IPs na subnet
+
+    Raises:
+        ValueError: Se o IP ou a mascara forem invalidos
+    """
+    return _iter_hosts(ipaddress.IPv4Network(f"{ip}/{netmask}", strict=False))
+
+
 def get_subnet_range(ip: str, netmask: str = "255.255.255.0") -> List[str]:
     """
     Obtem todos os IPs em uma subnet.
@@ -205,12 +935,8 @@ def get_subnet_range(ip: str, netmask: str = "255.255.255.0") -> List[str]:
         Lista de IPs na subnet
     """
     try:
-        # Cria objeto de rede
-        network = ipaddress.IPv4Network(f"{ip}/{netmask}", strict=False)
-
-        # Retorna todos os hosts (exclui rede e broadcast)
-        hosts = [str(host) for host in network.hosts()]
-        logger.debug(f"Subnet {network}: {len(hosts)} hosts")
+        hosts = list(iter_subnet_range(ip, netmask))
+        logger.debug("Subnet %s/%s: %d hosts", ip, netmask, len(hosts))
 
         return hosts
 
@@ -231,14 +957,16 @@ async def scan_port(host: str, port: int, timeout: float = 1.0) -> bool:
     Returns:
         True se a porta esta aberta
     """
+    # Apenas o handshake: socket nao bloqueante, sem streams/transport.
+    # TCP_FASTOPEN_CONNECT nao e usado de proposito: com cookie TFO em cache
+    # o kernel adia o SYN e o connect retorna sucesso sem handshake, o que
+    # marcaria como abertas portas fechadas do mesmo host.
+    family = socket.AF_INET6 if ":" in host else socket.AF_INET
+    sock = socket.socket(family, socket.SOCK_STREAM)
+    sock.setblocking(False)
     try:
-        # Cria conexao assincrona
-        _, writer = await asyncio.wait_for(
-            asyncio.open_connection(host, port),
-            timeout=timeout
-        )
-        writer.close()
-        await writer.wait_closed()
+        loop = asyncio.get_running_loop()
+        await asyncio.wait_for(loop.sock_connect(sock, (host, port)), timeout=timeout)
         return True
 
     except (asyncio.TimeoutError, ConnectionRefusedError, OSError):
@@ -248,6 +976,9 @@ async def scan_port(host: str, port: int, timeout: float = 1.0) -> bool:
         logger.debug(f"Erro ao escanear {host}:{port}: {e}")
         return False
 
+    finally:
+        sock.close()
+
 
 async def scan_ports(host: str, ports: List[int], timeout: float = 1.0) -> Dict[int, bool]:
     """
@@ -261,11 +992,20 @@ async def scan_ports(host: str, ports: List[int], timeout: float = 1.0) -> Dict[
     Returns:
         Dicionario {porta: aberta}
     """
-    tasks = {port: scan_port(host, port, timeout) for port in ports}
-    results = {}
+    sem = asyncio.Semaphore(MAX_CONCURRENT_PROBES)
 
-    for port, task in tasks.items():
-        results[port] = await task
+    # Resolve o host uma vez em vez de uma consulta por porta
+    address = await _resolve_address(host)
+    if address is None:
+        logger.debug("Hostname %s nao resolvido, nenhuma porta escaneada", host)
+        return dict.fromkeys(ports, False)
+
+    async def _bounded(port: int) -> bool:
+        async with sem:
+            return await scan_port(address, port, timeout)
+
+    values = await asyncio.gather(*[_bounded(port) for port in ports])
+    results = dict(zip(ports, values, strict=True))
 
     open_ports = [p for p, is_open in results.items() if is_open]
     if open_ports:
@@ -274,6 +1014,186 @@ async def scan_ports(host: str, ports: List[int], timeout: float = 1.0) -> Dict[
     return results
 
 
+def _syn_cookie(dst_ip: int, port: int) -> int:
+    """
+    Calcula o numero de sequencia do SYN a partir do destino.
+    A resposta valida tem ack = cookie + 1, sem guardar estado por host.
+
+    Args:
+        dst_ip: IP de destino como inteiro
+        port: Porta de destino
+
+    Returns:
+        Numero de sequencia de 32 bits
+    """
+    return hash((_SYN_SECRET, dst_ip, port)) & 0xFFFFFFFF
+
+
+def _tcp_checksum(src_ip: bytes, dst_ip: bytes, segment: bytes) -> int:
+    """
+    Calcula o checksum TCP com o pseudo-cabecalho IPv4.
+
+    Args:
+        src_ip: IP de origem (4 bytes)
+        dst_ip: IP de destino (4 bytes)
+        segment: Segmento TCP com o campo de checksum zerado
+
+    Returns:
+        Checksum de 16 bits
+    """
+    pseudo = src_ip + dst_ip + struct.pack("!BBH", 0, socket.IPPROTO_TCP, len(segment))
+    return _icmp_checksum(pseudo + segment)
+
+
+def _build_syn(src_ip: bytes, dst_ip: bytes, src_port: int, dst_port: int, seq: int) -> bytes:
+    """
+    Monta um segmento TCP SYN (sem cabecalho IP, adicionado pelo kernel).
+
+    Args:
+        src_ip: IP de origem (4 bytes)
+        dst_ip: IP de destino (4 bytes)
+        src_port: Porta de origem
+        dst_port: Porta de destino
+        seq: Numero de sequencia
+
+    Returns:
+        Segmento pronto para envio
+    """
+    header = _TCP_HEADER.pack(src_port, dst_port, seq, 0, 5 << 4, _TCP_SYN, 1024, 0, 0)
+    checksum = _tcp_checksum(src_ip, dst_ip, header)
+    return _TCP_HEADER.pack(src_port, dst_port, seq, 0, 5 << 4, _TCP_SYN, 1024, checksum, 0)
+
+
+def _source_ip_for(dst: str) -> str:
+    """
+    Obtem o IP local usado para alcancar o destino.
+
+    Args:
+        dst: IP de destino
+
+    Returns:
+        IP de origem
+    """
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+        s.connect((dst, 9))
+        return s.getsockname()[0]
+
+
+async def _connect_sweep(network: ipaddress.IPv4Network, port: int, timeout: float) -> List[str]:
+    """
+    Varredura por conexao completa (fallback sem sockets RAW).
+
+    Args:
+        network: Rede IPv4
+        port: Porta a verificar
+        timeout: Timeout por host
+
+    Returns:
+        IPs com a porta aberta
+    """
+    sem = asyncio.Semaphore(MAX_CONCURRENT_PROBES)
+
+    async def _probe(ip: str) -> Optional[str]:
+        async with sem:
+            return ip if await scan_port(ip, port, timeout) else None
+
+    results = await asyncio.gather(*[_probe(ip) for ip in _iter_hosts(network)])
+    return [ip for ip in results if ip]
+
+
+async def stateless_scan(
+    cidr: str,
+    port: int,
+    rate: int = 10000,
+    timeout: float = 1.0
+) -> List[str]:
+    """
+    Varre uma subnet procurando uma porta TCP aberta, estilo ZMap/Masscan.
+    Envia SYNs por um unico socket RAW com o numero de sequencia derivado
+    do destino (SYN cookie) e valida os SYN-ACKs em uma unica leitura, sem
+    estado por host. Requer CAP_NET_RAW; sem ele usa conexoes completas.
+
+    Args:
+        cidr: Subnet no formato "192.168.1.0/24"
+        port: Porta TCP a verificar
+        rate: Maximo de pacotes enviados por segundo
+        timeout: Tempo de espera pelas respostas apos o ultimo envio
+
+    Returns:
+        IPs com a porta aberta, em ordem crescente
+    """
+    network = ipaddress.IPv4Network(cidr, strict=False)
+    hosts = _host_int_range(network)
+    if not hosts:
+        return []
+
+    first_ip = socket.inet_ntoa(_IPV4_STRUCT.pack(hosts[0]))
+    try:
+        src_ip = socket.inet_aton(_source_ip_for(first_ip))
+    except OSError as e:
+        logger.debug("Sem rota para %s (%s), usando conexoes completas", network, e)
+        return await _connect_sweep(network, port, timeout)
+
+    try:
+        if _IS_WINDOWS:
+            raise PermissionError("Windows nao permite envio de TCP por socket RAW")
+        sock = socket.socket(socket.AF_INET, socket.SOCK_RAW, socket.IPPROTO_TCP)
+    except OSError as e:
+        logger.debug("Socket RAW indisponivel (%s), usando conexoes completas", e)
+        return await _connect_sweep(network, port, timeout)
+
+    loop = asyncio.get_running_loop()
+    found = set()
+
+    with sock:
+        sock.setblocking(False)
+        src_port = _SYN_SRC_PORT
+
+        async def _reader() -> None:
+            while True:
+                data = await loop.sock_recv(sock, 1024)
+                ihl = (data[0] & 0x0F) * 4
+                if len(data) < ihl + _TCP_HEADER.size:
+                    continue
+                sport, dport, _, ack, _, flags = _TCP_REPLY.unpack_from(data, ihl)
+                if sport != port or dport != src_port or flags & _TCP_SYN_ACK != _TCP_SYN_ACK:
+                    continue
+                reply_ip = _IPV4_STRUCT.unpack_from(data, 12)[0]
+                if ack == (_syn_cookie(reply_ip, port) + 1) & 0xFFFFFFFF:
+                    found.add(reply_ip)
+
+        reader = asyncio.create_task(_reader())
+        try:
+            batch = max(1, rate // 100)
+            pack = _IPV4_STRUCT.pack
+            for index, dst in enumerate(hosts, 1):
+                dst_bytes = pack(dst)
+                segment = _build_syn(src_ip, dst_bytes, src_port, port, _syn_cookie(dst, port))
+                addr = (socket.inet_ntoa(dst_bytes), 0)
+                try:
+                    try:
+                        sock.sendto(segment, addr)
+                    except BlockingIOError:
+                        # Buffer de envio cheio: espera o socket liberar e reenvia
+                        await loop.sock_sendto(sock, segment, addr)
+                except OSError as e:
+                    logger.debug("Falha ao enviar SYN para %s: %s", addr[0], e)
+                if index % batch == 0:
+                    await asyncio.sleep(batch / rate)
+
+            await asyncio.sleep(timeout)
+        finally:
+            reader.cancel()
+            try:
+                await reader
+            except (asyncio.CancelledError, OSError):
+                pass
+
+    open_hosts = [socket.inet_ntoa(_IPV4_STRUCT.pack(ip)) for ip in sorted(found)]
+    logger.debug("Varredura %s:%d: %d hosts com a porta aberta", network, port, len(open_hosts))
+    return open_hosts
+
+
 def get_broadcast_addresses() -> List[str]:
     """
     Obtem todos os enderecos de broadcast disponiveis.
@@ -282,9 +1202,15 @@ def get_broadcast_addresses() -> List[str]:
     Returns:
         Lista de enderecos de broadcast
     """
+    interfaces = _cached_interfaces()
+
+    # Recalcula apenas quando a lista de interfaces foi atualizada
+    if _BCAST_CACHE["gen"] == _IFACE_CACHE["gen"]:
+        return list(_BCAST_CACHE["value"])
+
     broadcasts = []
 
-    for iface in get_network_interfaces():
+    for iface in interfaces:
         if iface.broadcast and not iface.is_loopback and iface.is_up:
             broadcasts.append(iface.broadcast)
             logger.debug(f"Broadcast disponivel: {iface.broadcast} ({iface.name})")
@@ -293,12 +1219,31 @@ def get_broadcast_addresses() -> List[str]:
     if not broadcasts:
         broadcasts.append("255.255.255.255")
 
-    return broadcasts
+    _BCAST_CACHE["value"] = broadcasts
+    _BCAST_CACHE["gen"] = _IFACE_CACHE["gen"]
+    return list(broadcasts)
+
+
+@lru_cache(maxsize=128)
+def _resolve_cached(hostname: str, ttl_bucket: int) -> str:
+    """
+    Resolve um hostname, memorizado por (hostname, janela de tempo).
+    Falhas geram excecao e por isso nao ficam em cache.
+
+    Args:
+        hostname: Nome do host
+        ttl_bucket: Janela de RESOLVE_CACHE_TTL segundos da consulta
+
+    Returns:
+        IP resolvido
+    """
+    return socket.gethostbyname(hostname)
 
 
 def resolve_hostname(hostname: str) -> Optional[str]:
     """
     Resolve um hostname para IP.
+    Resolucoes bem sucedidas ficam em cache por ate RESOLVE_CACHE_TTL segundos.
 
     Args:
         hostname: Nome do host
@@ -307,8 +1252,8 @@ def resolve_hostname(hostname: str) -> Optional[str]:
         IP ou None
     """
     try:
-        ip = socket.gethostbyname(hostname)
-        logger.debug(f"Hostname {hostname} resolvido para {ip}")
+        ip = _resolve_cached(hostname, int(time.monotonic() // RESOLVE_CACHE_TTL))
+        logger.debug("Hostname %s resolvido para %s", hostname, ip)
         return ip
     except socket.gaierror as e:
         logger.warning(f"Falha ao resolver hostname {hostname}: {e}")
@@ -317,9 +1262,21 @@ def resolve_hostname(hostname: str) -> Optional[str]:
 
 def get_hostname() -> str:
     """
-    Obtem o hostname da maquina local.
+    Obtem o hostname da maquina local (lido uma vez no import).
 
     Returns:
         Hostname
     """
-    return socket.gethostname()
+    return _HOSTNAME_CACHE["value"]
+
+
+def refresh_hostname() -> str:
+    """
+    Le novamente o hostname da maquina local.
+
+    Returns:
+        Hostname atualizado
+    """
+    hostname = socket.gethostname()
+    _HOSTNAME_CACHE["value"] = hostname
+    return hostname